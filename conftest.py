@@ -17,7 +17,9 @@ _HA_MODULES = [
     "homeassistant.helpers.event",
     "homeassistant.helpers.restore_state",
     "homeassistant.helpers.selector",
+    "homeassistant.helpers.storage",
     "homeassistant.data_entry_flow",
+    "homeassistant.exceptions",
     "homeassistant.components",
     "homeassistant.components.sensor",
     "homeassistant.components.binary_sensor",
@@ -58,9 +60,21 @@ vol_mock.Optional = MagicMock(side_effect=lambda k, **kw: k)
 vol_mock.Coerce = MagicMock(side_effect=lambda t: t)
 vol_mock.In = MagicMock(side_effect=lambda x: x)
 
+class _EntityStub:
+    """Mirror HA Entity's ``_attr_*``-backed name and device_info properties."""
+
+    @property
+    def name(self):
+        return getattr(self, "_attr_name", None)
+
+    @property
+    def device_info(self):
+        return getattr(self, "_attr_device_info", None)
+
+
 # Sensor stubs
 sensor_mod = sys.modules["homeassistant.components.sensor"]
-sensor_mod.SensorEntity = type("SensorEntity", (), {})
+sensor_mod.SensorEntity = type("SensorEntity", (_EntityStub,), {})
 sensor_mod.SensorDeviceClass = MagicMock()
 sensor_mod.SensorStateClass = MagicMock()
 sensor_mod.SensorEntityDescription = type(
@@ -71,7 +85,7 @@ sensor_mod.SensorEntityDescription = type(
 
 # Binary sensor stubs
 binary_sensor_mod = sys.modules["homeassistant.components.binary_sensor"]
-binary_sensor_mod.BinarySensorEntity = type("BinarySensorEntity", (), {})
+binary_sensor_mod.BinarySensorEntity = type("BinarySensorEntity", (_EntityStub,), {})
 
 # Calendar stubs
 calendar_mod = sys.modules["homeassistant.components.calendar"]
@@ -94,20 +108,20 @@ event_mod.async_track_time_interval = MagicMock()
 
 # Number stubs
 number_mod = sys.modules["homeassistant.components.number"]
-number_mod.NumberEntity = type("NumberEntity", (), {})
+number_mod.NumberEntity = type("NumberEntity", (_EntityStub,), {})
 number_mod.NumberMode = MagicMock()
 
 # Select stubs
 select_mod = sys.modules["homeassistant.components.select"]
-select_mod.SelectEntity = type("SelectEntity", (), {})
+select_mod.SelectEntity = type("SelectEntity", (_EntityStub,), {})
 
 # Switch stubs
 switch_mod = sys.modules["homeassistant.components.switch"]
-switch_mod.SwitchEntity = type("SwitchEntity", (), {})
+switch_mod.SwitchEntity = type("SwitchEntity", (_EntityStub,), {})
 
 # Text stubs
 text_mod = sys.modules["homeassistant.components.text"]
-text_mod.TextEntity = type("TextEntity", (), {})
+text_mod.TextEntity = type("TextEntity", (_EntityStub,), {})
 
 # Selector stubs
 selector_mod = sys.modules["homeassistant.helpers.selector"]
@@ -126,6 +140,13 @@ selector_mod.TextSelector = type(
 restore_state_mod = sys.modules["homeassistant.helpers.restore_state"]
 restore_state_mod.RestoreEntity = type("RestoreEntity", (), {})
 
+# Exception stubs — real classes so setup code can catch them
+exceptions_mod = sys.modules["homeassistant.exceptions"]
+exceptions_mod.HomeAssistantError = type("HomeAssistantError", (Exception,), {})
+exceptions_mod.ConfigEntryNotReady = type(
+    "ConfigEntryNotReady", (exceptions_mod.HomeAssistantError,), {}
+)
+
 # Update coordinator stubs
 def _coordinator_entity_init(self, coordinator, **kw):
     self.coordinator = coordinator
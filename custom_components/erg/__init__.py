@@ -5,6 +5,7 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import ErgApiClient
@@ -46,7 +47,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             pass  # Server may not support keys yet — keep session token
 
     coordinator = ErgScheduleCoordinator(hass, entry, api_client)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        # Server unreachable: keep acting on the persisted schedule if it
+        # still covers the present, otherwise let HA retry the setup.
+        if not await coordinator.async_load_last_result():
+            raise
 
     slot_duration = entry.options.get("slot_duration", DEFAULT_SLOT_DURATION)
     executor = ScheduleExecutor(hass, coordinator, slot_duration)
@@ -125,6 +132,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted schedule when a config entry is deleted."""
+    from homeassistant.helpers.storage import Store
+
+    from .coordinator import _STORAGE_VERSION, last_result_store_key
+
+    await Store(hass, _STORAGE_VERSION, last_result_store_key(entry.entry_id)).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle config entry updates — options changes and subentry addition/deletion."""
     from datetime import timedelta
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -10,65 +13,43 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DEFAULT_SLOT_DURATION, DOMAIN, friendly_name, make_job_device_info, parse_slot_duration_seconds
-
-
-def _sanitize_entity(entity_id: str) -> str:
-    """Replace dots with underscores for unique ID usage."""
-    return entity_id.replace(".", "_")
+from .const import (
+    DEFAULT_SLOT_DURATION,
+    DOMAIN,
+    friendly_name,
+    job_unique_id_prefix,
+    make_job_device_info,
+    parse_slot_duration_seconds,
+)
+from .job_entities import add_entities_by_subentry, current_time, public_job_items
+from .schedule_index import get_schedule_index
 
 
 def _get_current_grid_power(
-    data: dict[str, Any],
+    coordinator: Any,
     now: datetime,
     slot_duration: timedelta,
 ) -> tuple[float, float]:
     """Return (grid_import, grid_export) for the current time slot, or (0, 0)."""
-    for entry in data.get("battery_profile") or []:
-        slot_start = datetime.fromisoformat(entry["time"])
-        slot_end = slot_start + slot_duration
-        if slot_start <= now < slot_end:
-            return (
-                float(entry.get("grid_import", 0)),
-                float(entry.get("grid_export", 0)),
-            )
-    return (0.0, 0.0)
+    return get_schedule_index(coordinator).grid_power_at(now, slot_duration)
 
 
 def _get_running_load_ac(
-    data: dict[str, Any],
+    coordinator: Any,
     now: datetime,
     slot_duration: timedelta,
 ) -> float:
     """Sum AC power of all non-solar (non-dunder) assignments running now."""
-    total = 0.0
-    for assignment in data.get("assignments") or []:
-        if assignment.get("entity", "").startswith("__"):
-            continue
-        for slot_str in assignment.get("slots") or []:
-            slot_start = datetime.fromisoformat(slot_str)
-            if slot_start <= now < slot_start + slot_duration:
-                total += float(assignment.get("ac_power", 0))
-                break
-    return total
+    return get_schedule_index(coordinator).load_ac_at(now, slot_duration)
 
 
 def _get_running_solar_dc(
-    data: dict[str, Any],
+    coordinator: Any,
     now: datetime,
     slot_duration: timedelta,
 ) -> float:
     """Sum absolute DC power of solar (__solar__) assignments running now."""
-    total = 0.0
-    for assignment in data.get("assignments") or []:
-        if assignment.get("entity") != "__solar__":
-            continue
-        for slot_str in assignment.get("slots") or []:
-            slot_start = datetime.fromisoformat(slot_str)
-            if slot_start <= now < slot_start + slot_duration:
-                total += abs(float(assignment.get("dc_power", 0)))
-                break
-    return total
+    return get_schedule_index(coordinator).solar_dc_at(now, slot_duration)
 
 
 async def async_setup_entry(
@@ -83,30 +64,22 @@ async def async_setup_entry(
     # Store callback for dynamic creation by services
     entry_data["add_job_binary_sensors"] = async_add_entities
 
-    subentry_id_map = entry_data.get("_subentry_id_map", {})
-    no_subentry: list[BinarySensorEntity] = []
-    by_subentry: dict[str, list[BinarySensorEntity]] = {}
+    per_job_binary_sensors = entry_data.setdefault("per_job_binary_sensors", {})
+    by_subentry: defaultdict[str | None, list[BinarySensorEntity]] = defaultdict(list)
 
     # Derive binary sensors from live job entities
-    job_entities = entry_data.get("job_entities", {})
-    for entity_id in job_entities:
-        if entity_id.startswith("__"):
-            continue
-        sid = subentry_id_map.get(entity_id)
+    for entity_id, _job_entity, sid in public_job_items(entry_data):
         sensor = ErgScheduledBinarySensor(coordinator, entry, entity_id)
-        entry_data.setdefault("per_job_binary_sensors", {})[entity_id] = [sensor]
-        if sid is None:
-            no_subentry.append(sensor)
-        else:
-            by_subentry.setdefault(sid, []).append(sensor)
+        per_job_binary_sensors[entity_id] = [sensor]
+        by_subentry[sid].append(sensor)
 
     # Global battery binary sensors (not per-job)
-    no_subentry.append(ErgForceChargeSensor(coordinator, entry))
-    no_subentry.append(ErgForceDischargeSensor(coordinator, entry))
+    by_subentry[None].extend((
+        ErgForceChargeSensor(coordinator, entry),
+        ErgForceDischargeSensor(coordinator, entry),
+    ))
 
-    async_add_entities(no_subentry)
-    for sid, entities in by_subentry.items():
-        async_add_entities(entities, config_subentry_id=sid)
+    add_entities_by_subentry(async_add_entities, by_subentry)
 
 
 class ErgScheduledBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -115,17 +88,10 @@ class ErgScheduledBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator, entry: ConfigEntry, entity_id: str) -> None:
         super().__init__(coordinator)
         self._entity_id = entity_id
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry.entry_id}_erg_{sanitized}_active_now"
+        self._attr_unique_id = f"{job_unique_id_prefix(entry.entry_id, entity_id)}_active_now"
         self._entry = entry
-
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
-
-    @property
-    def name(self) -> str:
-        return f"Erg Active Now \u2014 {friendly_name(self._entity_id)}"
+        self._attr_name = f"Erg Active Now \u2014 {friendly_name(entity_id)}"
+        self._attr_device_info = make_job_device_info(entity_id)
 
     @property
     def is_on(self) -> bool | None:
@@ -137,21 +103,25 @@ class ErgScheduledBinarySensor(CoordinatorEntity, BinarySensorEntity):
         slot_seconds = parse_slot_duration_seconds(slot_duration_str)
         slot_duration = timedelta(seconds=slot_seconds)
 
-        now = datetime.now().astimezone()
-        return _is_entity_scheduled_now(data, self._entity_id, now, slot_duration)
+        now = current_time(self.coordinator)
+        return _is_entity_scheduled_now(self.coordinator, self._entity_id, now, slot_duration)
 
 
-class ErgForceChargeSensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor ON when grid imports more than scheduled loads need (battery charging from grid)."""
+class _ErgForceSensorBase(CoordinatorEntity, BinarySensorEntity, ABC):
+    """Base for the force charge/discharge sensors.
+
+    ``is_on`` is remembered for the schedule and "now" it was computed for,
+    so repeated reads during one coordinator push do the lookups once.
+    """
+
+    _unique_id_suffix: str
 
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
         self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_erg_force_charge"
-
-    @property
-    def name(self) -> str:
-        return "Erg Force Charge"
+        self._attr_unique_id = f"{entry.entry_id}_{self._unique_id_suffix}"
+        self._cached_key: tuple[Any, datetime] | None = None
+        self._cached_value: bool | None = None
 
     @property
     def is_on(self) -> bool | None:
@@ -159,57 +129,61 @@ class ErgForceChargeSensor(CoordinatorEntity, BinarySensorEntity):
         if data is None:
             return None
 
+        now = current_time(self.coordinator)
+        cached_key = self._cached_key
+        if cached_key is not None and cached_key[0] is data and cached_key[1] == now:
+            return self._cached_value
+
         slot_duration_str = self._entry.options.get("slot_duration", DEFAULT_SLOT_DURATION)
         slot_seconds = parse_slot_duration_seconds(slot_duration_str)
         slot_duration = timedelta(seconds=slot_seconds)
 
-        now = datetime.now().astimezone()
-        grid_import, _ = _get_current_grid_power(data, now, slot_duration)
-        load_ac = _get_running_load_ac(data, now, slot_duration)
-        return grid_import - load_ac > 0
+        value = self._compute_is_on(now, slot_duration)
+        self._cached_key = (data, now)
+        self._cached_value = value
+        return value
 
+    @abstractmethod
+    def _compute_is_on(self, now: datetime, slot_duration: timedelta) -> bool:
+        """Compute the state for the current schedule at *now*."""
 
-class ErgForceDischargeSensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor ON when grid exports more than solar provides (battery discharging to grid)."""
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_erg_force_discharge"
+class ErgForceChargeSensor(_ErgForceSensorBase):
+    """Binary sensor ON when grid imports more than scheduled loads need (battery charging from grid)."""
 
-    @property
-    def name(self) -> str:
-        return "Erg Force Discharge"
+    _attr_name = "Erg Force Charge"
+    _unique_id_suffix = "erg_force_charge"
 
-    @property
-    def is_on(self) -> bool | None:
-        data = self.coordinator.data
-        if data is None:
-            return None
+    def _compute_is_on(self, now: datetime, slot_duration: timedelta) -> bool:
+        grid_import, _ = _get_current_grid_power(self.coordinator, now, slot_duration)
+        load_ac = _get_running_load_ac(self.coordinator, now, slot_duration)
+        return grid_import - load_ac > 0
 
-        slot_duration_str = self._entry.options.get("slot_duration", DEFAULT_SLOT_DURATION)
-        slot_seconds = parse_slot_duration_seconds(slot_duration_str)
-        slot_duration = timedelta(seconds=slot_seconds)
 
-        now = datetime.now().astimezone()
-        _, grid_export = _get_current_grid_power(data, now, slot_duration)
-        solar_dc = _get_running_solar_dc(data, now, slot_duration)
+class ErgForceDischargeSensor(_ErgForceSensorBase):
+    """Binary sensor ON when grid exports more than solar provides (battery discharging to grid)."""
+
+    _attr_name = "Erg Force Discharge"
+    _unique_id_suffix = "erg_force_discharge"
+
+    def _compute_is_on(self, now: datetime, slot_duration: timedelta) -> bool:
+        _, grid_export = _get_current_grid_power(self.coordinator, now, slot_duration)
+        solar_dc = _get_running_solar_dc(self.coordinator, now, slot_duration)
         return grid_export - solar_dc > 0
 
 
 def _is_entity_scheduled_now(
-    data: dict[str, Any],
+    coordinator: Any,
     entity_id: str,
     now: datetime,
     slot_duration: timedelta,
 ) -> bool:
     """Check if now falls within any scheduled slot for the given entity."""
-    for assignment in data.get("assignments") or []:
-        if assignment.get("entity") != entity_id:
-            continue
-        for slot_str in assignment.get("slots") or []:
-            slot_start = datetime.fromisoformat(slot_str)
-            slot_end = slot_start + slot_duration
-            if slot_start <= now < slot_end:
-                return True
-    return False
+    table = get_schedule_index(coordinator).entity_slots.get(entity_id)
+    if table is None:
+        return False
+    slot_times = table[0]
+    # The latest slot starting at or before now is the only one that can
+    # still be running: every earlier slot ends no later than it does.
+    pos = bisect_right(slot_times, now)
+    return pos > 0 and now < slot_times[pos - 1] + slot_duration
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -10,7 +11,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DEFAULT_SLOT_DURATION, DOMAIN, friendly_name as _friendly_name, parse_slot_duration_seconds
+from .const import (
+    DEFAULT_SLOT_DURATION,
+    DOMAIN,
+    friendly_name as _friendly_name,
+    parse_slot_duration_seconds,
+    parse_slot_time,
+)
+from .job_entities import current_time
+from .schedule_index import get_schedule_index
 
 
 async def async_setup_entry(
@@ -31,6 +40,12 @@ class ErgScheduleCalendar(CoordinatorEntity, CalendarEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_erg_schedule_calendar"
         self._attr_name = "Erg Schedule"
+        # Events built from the schedule object in _events_data, sorted by
+        # start, with the running maximum of their ends for range bisects.
+        self._events_data: dict[str, Any] | None = None
+        self._events: list[CalendarEvent] = []
+        self._event_starts: list[datetime] = []
+        self._event_max_ends: list[datetime] = []
 
     @property
     def name(self) -> str:
@@ -39,11 +54,12 @@ class ErgScheduleCalendar(CoordinatorEntity, CalendarEntity):
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        events = self._build_events()
+        events = self._cached_events()
         if not events:
             return None
-        now = datetime.now().astimezone()
-        for ev in events:
+        now = current_time(self.coordinator)
+        # Every event before the first running max end past now has ended
+        for ev in events[bisect_right(self._event_max_ends, now):]:
             if ev.end > now:
                 return ev
         return None
@@ -55,12 +71,29 @@ class ErgScheduleCalendar(CoordinatorEntity, CalendarEntity):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return events within a date range."""
-        events = self._build_events()
-        return [
-            ev
-            for ev in events
-            if ev.end > start_date and ev.start < end_date
-        ]
+        events = self._cached_events()
+        lo = bisect_right(self._event_max_ends, start_date)
+        hi = bisect_left(self._event_starts, end_date)
+        return [ev for ev in events[lo:hi] if ev.end > start_date]
+
+    def _cached_events(self) -> list[CalendarEvent]:
+        """Return the events for the current schedule, building them once."""
+        data = self.coordinator.data
+        if data is None:
+            return []
+        if data is not self._events_data:
+            events = self._build_events()
+            max_ends: list[datetime] = []
+            running_end: datetime | None = None
+            for ev in events:
+                if running_end is None or ev.end > running_end:
+                    running_end = ev.end
+                max_ends.append(running_end)
+            self._events = events
+            self._event_starts = [ev.start for ev in events]
+            self._event_max_ends = max_ends
+            self._events_data = data
+        return self._events
 
     def _build_events(self) -> list[CalendarEvent]:
         """Convert schedule assignments into calendar events.
@@ -80,13 +113,10 @@ class ErgScheduleCalendar(CoordinatorEntity, CalendarEntity):
 
         events: list[CalendarEvent] = []
 
-        for assignment in data.get("assignments") or []:
+        for assignment in get_schedule_index(self.coordinator).user_assignments:
             entity_id = assignment.get("entity", "")
-            if entity_id.startswith("__"):
-                continue
-
             slots = sorted(
-                datetime.fromisoformat(s) for s in (assignment.get("slots") or [])
+                parse_slot_time(s) for s in (assignment.get("slots") or [])
             )
             if not slots:
                 continue
@@ -920,8 +920,17 @@ def _validate_tariff_input(user_input: dict[str, Any]) -> dict[str, str]:
 def _tariff_schema(
     defaults: dict[str, Any] | None = None,
 ) -> vol.Schema:
-    """Build the voluptuous schema for a tariff period form."""
-    d = defaults or {}
+    """Return the voluptuous schema for a tariff period form.
+
+    The empty form's schema is built once at import and shared.
+    """
+    if not defaults:
+        return _DEFAULT_TARIFF_SCHEMA
+    return _build_tariff_schema(defaults)
+
+
+def _build_tariff_schema(d: dict[str, Any]) -> vol.Schema:
+    """Build the tariff period form schema with defaults taken from *d*."""
     rec = d.get("recurrence") or {}
     days_str = ",".join(str(x) for x in rec.get("days_of_week", []))
 
@@ -961,6 +970,9 @@ def _tariff_schema(
     )
 
 
+_DEFAULT_TARIFF_SCHEMA = _build_tariff_schema({})
+
+
 # -- Dict builders -----------------------------------------------------------
 
 
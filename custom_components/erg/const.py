@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from datetime import datetime
+from functools import lru_cache
 
 import voluptuous as vol
 
@@ -22,10 +24,12 @@ _DURATION_RE = re.compile(r"(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?$")
 _TIME_RE = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)$")
 
 
+@lru_cache(maxsize=32)
 def parse_slot_duration_seconds(slot_duration_str: str) -> int:
     """Parse a Go-style duration string like '5m', '1h30m' to seconds.
 
     Supports h, m, s components. Returns 300 (5 min) as default if parsing fails.
+    Memoized, as entities re-read the slot_duration option on every state write.
     """
     if not slot_duration_str:
         return 300
@@ -42,6 +46,16 @@ def parse_slot_duration_seconds(slot_duration_str: str) -> int:
     return total if total > 0 else 300
 
 
+@lru_cache(maxsize=8192)
+def parse_slot_time(slot_str: str) -> datetime:
+    """Parse an ISO slot timestamp, memoized.
+
+    The same slot strings are re-parsed by every entity on every coordinator
+    push until the next schedule arrives, so caching avoids repeated parsing.
+    """
+    return datetime.fromisoformat(slot_str)
+
+
 def format_duration_seconds(total_seconds: int) -> str:
     """Format seconds as a Go-style duration string like '1h30m'.
 
@@ -96,6 +110,7 @@ def validate_time_str(value: str) -> str:
     return stripped
 
 
+@lru_cache(maxsize=4096)
 def friendly_name(entity_id: str) -> str:
     """Convert entity_id like 'switch.pool_pump' to 'Pool Pump'."""
     if "." in entity_id:
@@ -103,8 +118,25 @@ def friendly_name(entity_id: str) -> str:
     return entity_id.replace("_", " ").title()
 
 
+@lru_cache(maxsize=4096)
+def sanitize_entity_id(entity_id: str) -> str:
+    """Replace dots with underscores for unique ID usage."""
+    return entity_id.replace(".", "_")
+
+
+@lru_cache(maxsize=4096)
+def job_unique_id_prefix(entry_id: str, entity_id: str) -> str:
+    """Return the ``{entry_id}_erg_{sanitized}`` prefix shared by per-job entity unique IDs."""
+    return f"{entry_id}_erg_{sanitize_entity_id(entity_id)}"
+
+
+@lru_cache(maxsize=1024)
 def make_job_device_info(entity_id: str) -> dict:
-    """Build a DeviceInfo-compatible dict for grouping per-job entities under one device."""
+    """Build a DeviceInfo-compatible dict for grouping per-job entities under one device.
+
+    The result is cached and shared by every entity of the job, so callers
+    must not mutate it.
+    """
     friendly = friendly_name(entity_id)
     return {
         "identifiers": {(DOMAIN, entity_id)},
@@ -8,7 +8,8 @@ from datetime import date, datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import ErgApiClient, ErgApiError
@@ -20,9 +21,11 @@ from .const import (
     DOMAIN,
     format_duration_seconds,
     parse_slot_duration_seconds,
+    parse_slot_time,
 )
 from .job_entities import job_entity_to_dict
 from .jobs import expand_recurring_jobs
+from .schedule_index import ScheduleIndex
 from .tariff_periods import expand_recurring_tariffs
 from .solar import get_solar_forecast, solar_forecast_to_boxes
 
@@ -30,6 +33,21 @@ _LOGGER = logging.getLogger(__name__)
 
 _SCHEDULE_POLL_INTERVAL = 2  # seconds between polls
 _SCHEDULE_POLL_MAX_ATTEMPTS = 60  # 2-minute total timeout
+_STORAGE_VERSION = 1
+_STORAGE_SAVE_DELAY = 10  # seconds; coalesces saves, flushed on shutdown
+
+
+def last_result_store_key(entry_id: str) -> str:
+    """Return the storage key for the persisted last-known-good schedule."""
+    return f"{DOMAIN}_{entry_id}_last_result"
+
+
+def _latest_slot_start(result: dict[str, Any]) -> datetime | None:
+    """Return the start of the latest slot in a schedule result, if any."""
+    times = [entry.get("time") for entry in result.get("battery_profile") or []]
+    for assignment in result.get("assignments") or []:
+        times.extend(assignment.get("slots") or [])
+    return max((datetime.fromisoformat(t) for t in times if t), default=None)
 
 
 def _extend_tariff_coverage(
@@ -254,6 +272,57 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._tracking_date: date | None = None
         self._last_solve_status: str = "unknown"
         self._last_solve_error: str = ""
+        # Set only while listeners are being notified, so every entity
+        # recomputing its state for one push sees the same instant.
+        self.update_now: datetime | None = None
+        # Lookup tables for ``data``, see schedule_index.get_schedule_index
+        self.schedule_index: ScheduleIndex | None = None
+        self._store: Store = Store(
+            hass, _STORAGE_VERSION, last_result_store_key(config_entry.entry_id)
+        )
+
+    async def async_load_last_result(self) -> bool:
+        """Seed ``data`` with the schedule persisted by a previous run.
+
+        Returns True if a stored schedule was loaded.  Used when the first
+        fetch fails, so the executor can keep acting on the last-known-good
+        schedule.  A schedule whose last slot has already ended is ignored.
+
+        ``last_update_success`` is deliberately left False: the restored
+        schedule drives the executor only, and entities stay unavailable
+        until a fetch from the server succeeds.
+        """
+        try:
+            stored = await self._store.async_load()
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning("Failed to load persisted schedule", exc_info=True)
+            return False
+        if not isinstance(stored, dict):
+            return False
+
+        try:
+            latest = _latest_slot_start(stored)
+        except (ValueError, TypeError):
+            latest = None
+        slot_seconds = parse_slot_duration_seconds(
+            self.config_entry.options.get("slot_duration", DEFAULT_SLOT_DURATION)
+        )
+        now = datetime.now().astimezone()
+        if latest is None or latest + timedelta(seconds=slot_seconds) <= now:
+            _LOGGER.debug("Ignoring persisted schedule that has already ended")
+            return False
+
+        self.data = stored
+        return True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, sharing one "now" across their state writes."""
+        self.update_now = datetime.now().astimezone()
+        try:
+            super().async_update_listeners()
+        finally:
+            self.update_now = None
 
     def get_elapsed(self, entity_id: str) -> float:
         """Return elapsed seconds for *entity_id* today."""
@@ -290,7 +359,7 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if entity_id.startswith("__"):
                 continue
             for slot_str in assignment.get("slots") or []:
-                slot_end = datetime.fromisoformat(slot_str) + slot_duration
+                slot_end = parse_slot_time(slot_str) + slot_duration
                 if window_start < slot_end <= window_end:
                     self._elapsed_today[entity_id] = (
                         self._elapsed_today.get(entity_id, 0) + slot_seconds
@@ -320,7 +389,7 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not slots:
                 continue
 
-            parsed = sorted((datetime.fromisoformat(s), s) for s in slots)
+            parsed = sorted((parse_slot_time(s), s) for s in slots)
 
             active_idx = None
             for i, (slot_start, _) in enumerate(parsed):
@@ -451,6 +520,11 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         active_runs = self._find_active_runs(now, slot_seconds)
         slot_td = timedelta(seconds=slot_seconds)
 
+        # Box start times are ISO strings, so "starts today" is a prefix test.
+        tracking_date_iso = (
+            self._tracking_date.isoformat() if self._tracking_date else None
+        )
+
         adjusted_boxes: list[dict[str, Any]] = []
         for box in all_boxes:
             entity_id = box["entity"]
@@ -465,8 +539,7 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 continue
 
             # Only deduct elapsed from today's boxes
-            box_start = datetime.fromisoformat(box["start_time"])
-            if box_start.date() != self._tracking_date:
+            if box["start_time"][:10] != tracking_date_iso:
                 adjusted_boxes.append(box)
                 continue
 
@@ -487,22 +560,26 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 continue  # budget exhausted, exclude from API request
 
             if preserved_slots:
-                last_preserved = max(
-                    datetime.fromisoformat(s) for s in preserved_slots
-                )
-                box["start_time"] = (last_preserved + slot_td).isoformat()
+                last_preserved = max(parse_slot_time(s) for s in preserved_slots)
+                effective_start = last_preserved + slot_td
+                box["start_time"] = effective_start.isoformat()
+            else:
+                # Recurring windows repeat across refreshes, so the memoized
+                # parser usually has these already.
+                effective_start = parse_slot_time(box["start_time"])
 
             # Cap remaining at the available window. A job cannot run
             # longer than its window, and sending a budget that exceeds
             # the window causes incorrect power scaling in the scheduler.
-            effective_start = datetime.fromisoformat(box["start_time"])
-            box_finish = datetime.fromisoformat(box["finish_time"])
+            box_finish = parse_slot_time(box["finish_time"])
             window_secs = max(
                 0, int((box_finish - effective_start).total_seconds())
             )
             remaining = min(remaining, window_secs)
 
-            box["maximum_duration"] = format_duration_seconds(int(remaining))
+            # Nothing elapsed, preserved or capped: keep the original string.
+            if remaining < max_secs:
+                box["maximum_duration"] = format_duration_seconds(int(remaining))
 
             adjusted_boxes.append(box)
 
@@ -645,7 +722,8 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         result["import_price_threshold"] = import_threshold
         result["export_price_threshold"] = export_threshold
 
-        # 10. Mark solve as successful and return
+        # 10. Mark solve as successful, persist for restarts and return
+        self._store.async_delay_save(lambda: result, _STORAGE_SAVE_DELAY)
         self._last_solve_status = "ok"
         self._last_solve_error = ""
         try:
@@ -699,6 +777,18 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not battery_profile or not tariff_periods:
             return None, None
 
+        # Parse each period's bounds once rather than once per active slot
+        parsed_periods: list[tuple[datetime, datetime, dict[str, Any]]] = []
+        for period in tariff_periods:
+            try:
+                parsed_periods.append((
+                    datetime.fromisoformat(period["start"]),
+                    datetime.fromisoformat(period["end"]),
+                    period,
+                ))
+            except (ValueError, TypeError, KeyError):
+                continue
+
         import_prices: list[float] = []
         export_prices: list[float] = []
 
@@ -707,7 +797,7 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not t_str:
                 continue
             try:
-                t = datetime.fromisoformat(t_str)
+                t = parse_slot_time(t_str)
             except (ValueError, TypeError):
                 continue
 
@@ -716,12 +806,7 @@ class ErgScheduleCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             if grid_import > 0.01 or grid_export > 0.01:
                 # Find the matching tariff period
-                for period in tariff_periods:
-                    try:
-                        p_start = datetime.fromisoformat(period["start"])
-                        p_end = datetime.fromisoformat(period["end"])
-                    except (ValueError, TypeError, KeyError):
-                        continue
+                for p_start, p_end, period in parsed_periods:
                     if p_start <= t < p_end:
                         if grid_import > 0.01:
                             import_prices.append(period.get("import_price", 0))
@@ -13,7 +13,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DEFAULT_SLOT_DURATION, parse_slot_duration_seconds
+from .const import DEFAULT_SLOT_DURATION, parse_slot_duration_seconds, parse_slot_time
+from .schedule_index import get_schedule_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,18 +72,15 @@ class ScheduleExecutor:
         if now is None:
             now = datetime.now().astimezone()
 
-        for assignment in data.get("assignments") or []:
+        for assignment in get_schedule_index(self._coordinator).user_assignments:
             entity_id = assignment.get("entity", "")
-            if entity_id.startswith("__"):
-                continue
-
             should_be_on = self._is_slot_active(assignment, now)
             await self._apply_state(entity_id, should_be_on)
 
     def _is_slot_active(self, assignment: dict[str, Any], now: datetime) -> bool:
         """Check if now falls within any slot for this assignment."""
         for slot_str in assignment.get("slots") or []:
-            slot_start = datetime.fromisoformat(slot_str)
+            slot_start = parse_slot_time(slot_str)
             slot_end = slot_start + self._slot_duration
             if slot_start <= now < slot_end:
                 return True
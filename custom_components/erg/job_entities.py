@@ -7,12 +7,13 @@ Job configuration is stored as flat entity attributes.
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import make_job_device_info
+from .const import make_job_device_info, sanitize_entity_id
 
 
 class ErgJobEntity(RestoreEntity, SensorEntity):
@@ -21,15 +22,12 @@ class ErgJobEntity(RestoreEntity, SensorEntity):
     _attr_icon = "mdi:briefcase-clock"
 
     def __init__(self, entry_id: str, attrs: dict[str, Any]) -> None:
-        sanitized = attrs["entity_id"].replace(".", "_")
+        sanitized = sanitize_entity_id(attrs["entity_id"])
         self._attr_unique_id = f"{entry_id}_job_{sanitized}"
         self._attr_name = f"Erg Job {attrs['entity_id']}"
         self._job_attrs = dict(attrs)
         self._entry_id = entry_id
-
-    @property
-    def device_info(self):
-        return make_job_device_info(self._job_attrs["entity_id"])
+        self._attr_device_info = make_job_device_info(attrs["entity_id"])
 
     @property
     def native_value(self) -> str:
@@ -95,6 +93,48 @@ class ErgJobEntity(RestoreEntity, SensorEntity):
         return cls(entry_id, attrs)
 
 
+def public_job_items(
+    entry_data: dict[str, Any],
+) -> list[tuple[str, ErgJobEntity, str | None]]:
+    """Return ``(entity_id, job_entity, subentry_id)`` for each public job.
+
+    Dunder (internal) entity ids are dropped here so platform setup loops
+    need not re-check them.  ``subentry_id`` is None for jobs that are not
+    attached to a config subentry.
+    """
+    subentry_id_map = entry_data.get("_subentry_id_map", {})
+    return [
+        (eid, job_entity, subentry_id_map.get(eid))
+        for eid, job_entity in entry_data.get("job_entities", {}).items()
+        if not eid.startswith("__")
+    ]
+
+
+def add_entities_by_subentry(
+    async_add_entities: Any,
+    by_subentry: dict[str | None, list[Any]],
+) -> None:
+    """Add grouped entities with one ``async_add_entities`` call per group.
+
+    The ``None`` group (entities not attached to a config subentry) is added
+    first; every other group is added with its ``config_subentry_id``.
+    """
+    no_subentry = by_subentry.get(None)
+    if no_subentry:
+        async_add_entities(no_subentry)
+    for sid, entities in by_subentry.items():
+        if sid is not None and entities:
+            async_add_entities(entities, config_subentry_id=sid)
+
+
+def current_time(coordinator: Any) -> datetime:
+    """Return the coordinator's shared push-time "now", or the current time."""
+    now = coordinator.update_now
+    if now is None:
+        now = datetime.now().astimezone()
+    return now
+
+
 def job_entity_to_dict(entity: ErgJobEntity) -> dict[str, Any]:
     """Reconstruct the nested job dict that expand_recurring_jobs() expects.
 
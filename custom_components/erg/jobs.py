@@ -3,29 +3,46 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta, tzinfo
+from functools import lru_cache
 from typing import Any
 
 
-def day_matches(day: date, recurrence: dict[str, Any]) -> bool:
-    """Check if a calendar date matches a recurrence rule."""
-    weekday = day.weekday()  # 0=Monday, 6=Sunday
+_ALL_WEEKDAYS = frozenset(range(7))
+_NO_WEEKDAYS: frozenset[int] = frozenset()
+
+
+def recurrence_weekdays(recurrence: dict[str, Any]) -> frozenset[int]:
+    """Return the set of weekdays (0=Monday, 6=Sunday) a recurrence rule matches.
+
+    Resolving the rule once per definition lets callers test each day in the
+    horizon with a set lookup instead of re-dispatching on the frequency.
+    """
     freq = recurrence["frequency"]
 
     if freq == "daily":
-        return True
+        return _ALL_WEEKDAYS
     elif freq == "weekdays":
-        return weekday <= 4
+        return frozenset(range(5))
     elif freq == "weekends":
-        return weekday >= 5
+        return frozenset((5, 6))
     elif freq == "weekly":
-        return weekday == recurrence.get("day_of_week", 0)
+        return frozenset((recurrence.get("day_of_week", 0),))
     elif freq == "custom":
-        return weekday in recurrence.get("days_of_week", [])
-    return False
+        return frozenset(recurrence.get("days_of_week", []))
+    return _NO_WEEKDAYS
+
+
+def day_matches(day: date, recurrence: dict[str, Any]) -> bool:
+    """Check if a calendar date matches a recurrence rule."""
+    return day.weekday() in recurrence_weekdays(recurrence)
 
 
+@lru_cache(maxsize=64)
 def _parse_time(s: str) -> time:
-    """Parse a HH:MM time string."""
+    """Parse a HH:MM time string, memoized.
+
+    Jobs and tariffs reuse a handful of window times across every refresh.
+    """
     parts = s.split(":")
     return time(int(parts[0]), int(parts[1]))
 
@@ -70,16 +87,20 @@ def expand_recurring_jobs(
             boxes.append(_make_box(job, effective_start, effective_end))
             continue
 
-        # Recurring job: expand across matching days
+        # Recurring job: expand across matching days.  The rule and window
+        # times are resolved once per job rather than once per day.
+        weekdays = recurrence_weekdays(recurrence)
+        if not weekdays:
+            continue
+        start_t = _parse_time(recurrence["time_window_start"])
+        end_t = _parse_time(recurrence["time_window_end"])
+        template = _recurrence_box_template(job, recurrence)
+
         day = current_day
         while day <= end_day:
-            if day_matches(day, recurrence):
-                window_start = datetime.combine(
-                    day, _parse_time(recurrence["time_window_start"])
-                ).replace(tzinfo=local_tz)
-                window_end = datetime.combine(
-                    day, _parse_time(recurrence["time_window_end"])
-                ).replace(tzinfo=local_tz)
+            if day.weekday() in weekdays:
+                window_start = datetime.combine(day, start_t, tzinfo=local_tz)
+                window_end = datetime.combine(day, end_t, tzinfo=local_tz)
 
                 # Overnight window wraps to next day
                 if window_end <= window_start:
@@ -90,9 +111,10 @@ def expand_recurring_jobs(
                 effective_end = min(window_end, horizon_end)
 
                 if effective_end > effective_start:
-                    boxes.append(
-                        _make_box_from_recurrence(job, recurrence, effective_start, effective_end)
-                    )
+                    box = template.copy()
+                    box["start_time"] = effective_start.isoformat()
+                    box["finish_time"] = effective_end.isoformat()
+                    boxes.append(box)
 
             day += timedelta(days=1)
 
@@ -124,17 +146,20 @@ def _make_box(
     }
 
 
-def _make_box_from_recurrence(
+def _recurrence_box_template(
     job: dict[str, Any],
     recurrence: dict[str, Any],
-    start: datetime,
-    end: datetime,
 ) -> dict[str, Any]:
-    """Create a PowerBox dict from a recurring job definition."""
+    """Create a PowerBox template from a recurring job definition.
+
+    All fields except ``start_time``/``finish_time`` are identical for every
+    day the job recurs on, so each emitted box is a shallow copy of this
+    template with only the two time fields filled in.
+    """
     return {
         "entity": job["entity_id"],
-        "start_time": start.isoformat(),
-        "finish_time": end.isoformat(),
+        "start_time": "",
+        "finish_time": "",
         "maximum_duration": recurrence["maximum_duration"],
         "minimum_duration": recurrence.get("minimum_duration", "0s"),
         "minimum_burst": recurrence.get("minimum_burst", "0s"),
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections import defaultdict
+from datetime import date
 from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
@@ -11,12 +12,8 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN, friendly_name, make_job_device_info
-from .job_entities import ErgJobEntity
-
-
-def _sanitize_entity(entity_id: str) -> str:
-    return entity_id.replace(".", "_")
+from .const import DOMAIN, friendly_name, job_unique_id_prefix, make_job_device_info
+from .job_entities import ErgJobEntity, add_entities_by_subentry, public_job_items
 
 
 class ErgJobNumber(NumberEntity):
@@ -44,19 +41,15 @@ class ErgJobNumber(NumberEntity):
         self._coordinator = coordinator
         self._entity_id = entity_id
         self._attr_key = attr
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry_id}_erg_{sanitized}_{suffix}"
+        self._attr_unique_id = f"{job_unique_id_prefix(entry_id, entity_id)}_{suffix}"
         self._attr_name = f"Erg {name_suffix} \u2014 {friendly_name(entity_id)}"
+        self._attr_device_info = make_job_device_info(entity_id)
         self._attr_icon = icon
         self._attr_native_min_value = native_min
         self._attr_native_max_value = native_max
         self._attr_native_step = native_step
         self._attr_native_unit_of_measurement = unit
 
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
-
     @property
     def native_value(self) -> float | None:
         val = self._job_entity.extra_state_attributes.get(self._attr_key)
@@ -91,19 +84,15 @@ class ErgJobElapsedNumber(RestoreEntity, NumberEntity):
     ) -> None:
         self._coordinator = coordinator
         self._entity_id = entity_id
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry_id}_erg_{sanitized}_elapsed_today"
+        self._attr_unique_id = f"{job_unique_id_prefix(entry_id, entity_id)}_elapsed_today"
         self._attr_name = f"Erg Elapsed Today \u2014 {friendly_name(entity_id)}"
+        self._attr_device_info = make_job_device_info(entity_id)
         self._attr_icon = "mdi:timer-outline"
         self._attr_native_min_value = 0
         self._attr_native_max_value = 1440
         self._attr_native_step = 1
         self._attr_native_unit_of_measurement = "min"
 
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
-
     @property
     def native_value(self) -> float:
         return self._coordinator.get_elapsed(self._entity_id) / 60.0
@@ -120,8 +109,7 @@ class ErgJobElapsedNumber(RestoreEntity, NumberEntity):
 
         # Only restore if the saved state is from today; stale values from
         # a previous day must not carry over.
-        now = datetime.now().astimezone()
-        if last_state.last_updated.date() != now.date():
+        if last_state.last_updated.astimezone().date() != date.today():
             return
 
         try:
@@ -198,20 +186,12 @@ async def async_setup_entry(
 
     entry_data["add_job_numbers"] = async_add_entities
 
-    subentry_id_map = entry_data.get("_subentry_id_map", {})
-    no_subentry: list[NumberEntity] = []
-    by_subentry: dict[str, list[NumberEntity]] = {}
-    for eid, job_entity in entry_data["job_entities"].items():
-        if eid.startswith("__"):
-            continue
-        sid = subentry_id_map.get(eid)
+    per_job_controls = entry_data.setdefault("per_job_controls", {})
+    by_subentry: defaultdict[str | None, list[NumberEntity]] = defaultdict(list)
+    controls_for = per_job_controls.setdefault
+    for eid, job_entity, sid in public_job_items(entry_data):
         numbers = create_job_numbers(job_entity, coordinator, entry.entry_id, eid)
-        entry_data.setdefault("per_job_controls", {}).setdefault(eid, []).extend(numbers)
-        if sid is None:
-            no_subentry.extend(numbers)
-        else:
-            by_subentry.setdefault(sid, []).extend(numbers)
-
-    async_add_entities(no_subentry)
-    for sid, entities in by_subentry.items():
-        async_add_entities(entities, config_subentry_id=sid)
+        controls_for(eid, []).extend(numbers)
+        by_subentry[sid].extend(numbers)
+
+    add_entities_by_subentry(async_add_entities, by_subentry)
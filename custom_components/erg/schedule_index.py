@@ -0,0 +1,286 @@
+"""Per-schedule lookup tables shared by the Erg entity platforms.
+
+Entities read the coordinator's schedule on every state write.  The tables
+here are derived from one schedule and built at most once per refresh, so
+each read is a dict lookup or bisect rather than a scan of all assignments.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Any
+
+from .const import parse_slot_time
+
+
+def _build_assignment_index(
+    assignments: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Merge all assignment dicts into one dict per entity.
+
+    Recurring jobs that span multiple days produce one assignment per day.
+    This merges them into a single dict so sensors report totals.  An
+    entity with a single assignment maps to the original dict; a copy is
+    only made once a second assignment has to be merged in.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    copied: set[str] = set()
+    for assignment in assignments:
+        entity_id = assignment.get("entity")
+        merged = index.get(entity_id)
+        if merged is None:
+            index[entity_id] = assignment
+        else:
+            if entity_id not in copied:
+                merged = dict(merged)
+                merged["slots"] = list(merged.get("slots") or [])
+                index[entity_id] = merged
+                copied.add(entity_id)
+            merged["slots"].extend(assignment.get("slots") or [])
+            merged["run_time_seconds"] = (
+                merged.get("run_time_seconds", 0)
+                + assignment.get("run_time_seconds", 0)
+            )
+            merged["energy_cost"] = (
+                merged.get("energy_cost", 0)
+                + assignment.get("energy_cost", 0)
+            )
+    return index
+
+
+def _build_slot_table(
+    assignments: list[dict[str, Any]],
+) -> tuple[list[datetime], list[str]]:
+    """Return parallel (slot_times, entities) lists sorted by slot time.
+
+    Expects user (non-dunder) assignments only.  The sort is stable, so
+    entities with identical slot times keep their assignment order.
+    """
+    pairs: list[tuple[datetime, str]] = []
+    for assignment in assignments:
+        entity = assignment.get("entity", "")
+        for slot_str in assignment.get("slots") or []:
+            pairs.append((parse_slot_time(slot_str), entity))
+    pairs.sort(key=lambda p: p[0])
+    return [p[0] for p in pairs], [p[1] for p in pairs]
+
+
+def _build_entity_slot_tables(
+    assignments: list[dict[str, Any]],
+) -> dict[str, tuple[list[datetime], list[str]]]:
+    """Return per-entity parallel (slot_times, slot_strings) lists sorted by time."""
+    pairs_by_entity: dict[str, list[tuple[datetime, str]]] = {}
+    for assignment in assignments:
+        slots = assignment.get("slots")
+        if not slots:
+            continue
+        pairs = pairs_by_entity.setdefault(assignment.get("entity", ""), [])
+        for slot_str in slots:
+            pairs.append((parse_slot_time(slot_str), slot_str))
+    tables = {}
+    for entity, pairs in pairs_by_entity.items():
+        pairs.sort(key=lambda p: p[0])
+        tables[entity] = ([p[0] for p in pairs], [p[1] for p in pairs])
+    return tables
+
+
+def _build_power_table(
+    assignments: list[dict[str, Any]],
+    power: Callable[[dict[str, Any]], float],
+) -> tuple[list[datetime], list[tuple[int, float]]]:
+    """Return sorted slot times with the (assignment position, *power*) of each.
+
+    Slots are kept one entry each rather than summed per start time, since
+    slots of different assignments need not share a grid and can overlap.
+    """
+    rows: list[tuple[datetime, int, float]] = []
+    for pos, assignment in enumerate(assignments):
+        slots = assignment.get("slots")
+        if not slots:
+            continue
+        value = power(assignment)
+        for slot_str in slots:
+            rows.append((parse_slot_time(slot_str), pos, value))
+    rows.sort(key=lambda r: r[0])
+    return [r[0] for r in rows], [(r[1], r[2]) for r in rows]
+
+
+def _build_grid_power_table(
+    profile: list[dict[str, Any]],
+) -> tuple[list[datetime], list[tuple[int, tuple[float, float]]]]:
+    """Return sorted profile times with the (row position, (import, export)) of each."""
+    rows: list[tuple[datetime, int, tuple[float, float]]] = []
+    for pos, entry in enumerate(profile):
+        rows.append((
+            parse_slot_time(entry["time"]),
+            pos,
+            (float(entry.get("grid_import", 0)), float(entry.get("grid_export", 0))),
+        ))
+    rows.sort(key=lambda r: r[0])
+    return [r[0] for r in rows], [(r[1], r[2]) for r in rows]
+
+
+def _running(
+    times: list[datetime], now: datetime, slot_duration: timedelta
+) -> range:
+    """Return the positions in sorted *times* of the slots running at *now*.
+
+    Every slot lasts *slot_duration*, so these are exactly the slots
+    starting in the half-open window (now - slot_duration, now].
+    """
+    return range(bisect_right(times, now - slot_duration), bisect_right(times, now))
+
+
+def _running_power(
+    table: tuple[list[datetime], list[tuple[int, float]]],
+    now: datetime,
+    slot_duration: timedelta,
+) -> float:
+    """Sum the power of assignments with a slot running at *now*.
+
+    An assignment counts once even if several of its slots overlap *now*.
+    """
+    times, values = table
+    powers = dict(values[i] for i in _running(times, now, slot_duration))
+    return sum((powers[pos] for pos in sorted(powers)), 0.0)
+
+
+def _build_battery_forecast(
+    profile: list[dict[str, Any]],
+) -> list[list[Any]]:
+    """Convert a battery profile into ``[epoch_ms, soc_kwh]`` chart points."""
+    forecast = []
+    for entry in profile:
+        ts = entry.get("time")
+        soc = entry.get("soc_kwh")
+        if ts is None or soc is None:
+            continue
+        epoch_ms = int(parse_slot_time(ts).timestamp() * 1000)
+        forecast.append([epoch_ms, soc])
+    return forecast
+
+
+class ScheduleIndex:
+    """Lookups derived from one schedule, built once per coordinator refresh.
+
+    Each table is built on first access, so a refresh only pays for the
+    lookups that some entity actually reads.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self._next_pos = 0
+
+    @cached_property
+    def _assignments(self) -> list[dict[str, Any]]:
+        return self.data.get("assignments") or []
+
+    @cached_property
+    def user_assignments(self) -> list[dict[str, Any]]:
+        """Assignments for user jobs, i.e. without the dunder (synthetic) ones."""
+        return [a for a in self._assignments if not a.get("entity", "").startswith("__")]
+
+    @cached_property
+    def solar_assignments(self) -> list[dict[str, Any]]:
+        """The synthetic ``__solar__`` assignments."""
+        return [a for a in self._assignments if a.get("entity") == "__solar__"]
+
+    @cached_property
+    def by_entity(self) -> dict[str, dict[str, Any]]:
+        """Merged assignment per entity."""
+        return _build_assignment_index(self._assignments)
+
+    @cached_property
+    def _slot_table(self) -> tuple[list[datetime], list[str]]:
+        return _build_slot_table(self.user_assignments)
+
+    @property
+    def slot_times(self) -> list[datetime]:
+        """Start times of all user slots, sorted."""
+        return self._slot_table[0]
+
+    @property
+    def slot_entities(self) -> list[str]:
+        """Entity for each entry of :attr:`slot_times`."""
+        return self._slot_table[1]
+
+    @cached_property
+    def entity_slots(self) -> dict[str, tuple[list[datetime], list[str]]]:
+        """Sorted (slot_times, slot_strings) per entity."""
+        return _build_entity_slot_tables(self._assignments)
+
+    @cached_property
+    def battery_forecast(self) -> list[list[Any]] | None:
+        """Battery profile as chart points, or None without a profile."""
+        profile = self.data.get("battery_profile")
+        return _build_battery_forecast(profile) if profile else None
+
+    @cached_property
+    def _load_ac_table(self) -> tuple[list[datetime], list[tuple[int, float]]]:
+        return _build_power_table(
+            self.user_assignments, lambda a: float(a.get("ac_power", 0))
+        )
+
+    @cached_property
+    def _solar_dc_table(self) -> tuple[list[datetime], list[tuple[int, float]]]:
+        return _build_power_table(
+            self.solar_assignments, lambda a: abs(float(a.get("dc_power", 0)))
+        )
+
+    @cached_property
+    def _grid_power_table(
+        self,
+    ) -> tuple[list[datetime], list[tuple[int, tuple[float, float]]]]:
+        return _build_grid_power_table(self.data.get("battery_profile") or [])
+
+    def load_ac_at(self, now: datetime, slot_duration: timedelta) -> float:
+        """Total AC power of user jobs with a slot running at *now*."""
+        return _running_power(self._load_ac_table, now, slot_duration)
+
+    def solar_dc_at(self, now: datetime, slot_duration: timedelta) -> float:
+        """Absolute DC power of solar slots running at *now*."""
+        return _running_power(self._solar_dc_table, now, slot_duration)
+
+    def grid_power_at(
+        self, now: datetime, slot_duration: timedelta
+    ) -> tuple[float, float]:
+        """(grid_import, grid_export) of the first profile row running at *now*."""
+        times, rows = self._grid_power_table
+        running = _running(times, now, slot_duration)
+        if not running:
+            return (0.0, 0.0)
+        return min((rows[i] for i in running), key=lambda r: r[0])[1]
+
+    def next_entity(self, now: datetime) -> str | None:
+        """Return the entity of the first slot starting after *now*.
+
+        The answer only changes when *now* crosses a slot boundary, so the
+        previous position is reused while it is still valid.
+        """
+        times = self.slot_times
+        pos = self._next_pos
+        if (pos > 0 and now < times[pos - 1]) or (pos < len(times) and now >= times[pos]):
+            pos = bisect_right(times, now)
+            self._next_pos = pos
+        if pos < len(times):
+            return self.slot_entities[pos]
+        return None
+
+
+def get_schedule_index(coordinator: Any) -> ScheduleIndex:
+    """Return the index for *coordinator*'s current schedule.
+
+    Each coordinator owns its index in ``coordinator.schedule_index``.  The
+    coordinator replaces its data dict on every refresh, so the index is
+    rebuilt when that identity changes and shared by all of the entry's
+    entities until then.
+    """
+    data = coordinator.data
+    index = coordinator.schedule_index
+    if index is None or index.data is not data:
+        index = ScheduleIndex(data)
+        coordinator.schedule_index = index
+    return index
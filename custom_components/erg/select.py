@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
@@ -9,12 +10,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, FREQUENCY_CHOICES, friendly_name, make_job_device_info
-from .job_entities import ErgJobEntity
-
-
-def _sanitize_entity(entity_id: str) -> str:
-    return entity_id.replace(".", "_")
+from .const import DOMAIN, FREQUENCY_CHOICES, friendly_name, job_unique_id_prefix, make_job_device_info
+from .job_entities import ErgJobEntity, add_entities_by_subentry, public_job_items
 
 
 class ErgJobFrequencySelect(SelectEntity):
@@ -34,13 +31,9 @@ class ErgJobFrequencySelect(SelectEntity):
         self._job_entity = job_entity
         self._coordinator = coordinator
         self._entity_id = entity_id
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry_id}_erg_{sanitized}_frequency"
+        self._attr_unique_id = f"{job_unique_id_prefix(entry_id, entity_id)}_frequency"
         self._attr_name = f"Erg Frequency \u2014 {friendly_name(entity_id)}"
-
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
+        self._attr_device_info = make_job_device_info(entity_id)
 
     @property
     def current_option(self) -> str | None:
@@ -76,20 +69,12 @@ async def async_setup_entry(
 
     entry_data["add_job_selects"] = async_add_entities
 
-    subentry_id_map = entry_data.get("_subentry_id_map", {})
-    no_subentry: list[ErgJobFrequencySelect] = []
-    by_subentry: dict[str, list[ErgJobFrequencySelect]] = {}
-    for eid, job_entity in entry_data["job_entities"].items():
-        if eid.startswith("__"):
-            continue
-        sid = subentry_id_map.get(eid)
+    per_job_controls = entry_data.setdefault("per_job_controls", {})
+    by_subentry: defaultdict[str | None, list[ErgJobFrequencySelect]] = defaultdict(list)
+    controls_for = per_job_controls.setdefault
+    for eid, job_entity, sid in public_job_items(entry_data):
         selects = create_job_selects(job_entity, coordinator, entry.entry_id, eid)
-        entry_data.setdefault("per_job_controls", {}).setdefault(eid, []).extend(selects)
-        if sid is None:
-            no_subentry.extend(selects)
-        else:
-            by_subentry.setdefault(sid, []).extend(selects)
-
-    async_add_entities(no_subentry)
-    for sid, entities in by_subentry.items():
-        async_add_entities(entities, config_subentry_id=sid)
+        controls_for(eid, []).extend(selects)
+        by_subentry[sid].extend(selects)
+
+    add_entities_by_subentry(async_add_entities, by_subentry)
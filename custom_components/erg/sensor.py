@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -15,37 +18,30 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, friendly_name, make_job_device_info
-from .job_entities import ErgJobEntity
+from .const import DOMAIN, friendly_name, job_unique_id_prefix, make_job_device_info
+from .job_entities import (
+    ErgJobEntity,
+    add_entities_by_subentry,
+    current_time,
+    public_job_items,
+)
+from .schedule_index import get_schedule_index
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class ErgSensorEntityDescription:
     """Describes an Erg sensor entity."""
 
-    def __init__(
-        self,
-        *,
-        key: str,
-        name: str,
-        device_class: Any = None,
-        state_class: Any = None,
-        native_unit_of_measurement: str | None = None,
-        suggested_unit_of_measurement: str | None = None,
-        value_fn: Any = None,
-        entity_registry_enabled_default: bool = True,
-        entity_registry_visible_default: bool = True,
-        entity_category: Any = None,
-    ) -> None:
-        self.key = key
-        self.name = name
-        self.device_class = device_class
-        self.state_class = state_class
-        self.native_unit_of_measurement = native_unit_of_measurement
-        self.suggested_unit_of_measurement = suggested_unit_of_measurement
-        self.value_fn = value_fn
-        self.entity_registry_enabled_default = entity_registry_enabled_default
-        self.entity_registry_visible_default = entity_registry_visible_default
-        self.entity_category = entity_category
+    key: str
+    name: str
+    device_class: Any = None
+    state_class: Any = None
+    native_unit_of_measurement: str | None = None
+    suggested_unit_of_measurement: str | None = None
+    value_fn: Any = None
+    entity_registry_enabled_default: bool = True
+    entity_registry_visible_default: bool = True
+    entity_category: Any = None
 
 
 GLOBAL_SENSORS: tuple[ErgSensorEntityDescription, ...] = (
@@ -134,29 +130,9 @@ GLOBAL_SENSORS: tuple[ErgSensorEntityDescription, ...] = (
 )
 
 
-def _sanitize_entity(entity_id: str) -> str:
-    """Replace dots with underscores for unique ID usage."""
-    return entity_id.replace(".", "_")
-
-
-def _find_next_job_entity(data: dict[str, Any], now: datetime) -> str | None:
+def _find_next_job_entity(coordinator: Any, now: datetime) -> str | None:
     """Find the entity_id of the nearest future scheduled job."""
-    earliest_entity = None
-    earliest_time = None
-
-    for assignment in data.get("assignments") or []:
-        entity = assignment.get("entity", "")
-        if entity.startswith("__"):
-            continue
-        for slot_str in assignment.get("slots") or []:
-            slot_time = datetime.fromisoformat(slot_str)
-            if slot_time > now:
-                if earliest_time is None or slot_time < earliest_time:
-                    earliest_time = slot_time
-                    earliest_entity = entity
-                break  # slots are ordered, first future slot is earliest for this entity
-
-    return earliest_entity
+    return get_schedule_index(coordinator).next_entity(now)
 
 
 async def async_setup_entry(
@@ -173,12 +149,12 @@ async def async_setup_entry(
     entry_data["add_per_job_sensors"] = async_add_entities
 
     # Global sensors (not associated with any subentry)
-    global_entities: list[SensorEntity] = []
-    for description in GLOBAL_SENSORS:
-        global_entities.append(ErgGlobalSensor(coordinator, entry, description))
+    global_entities: list[SensorEntity] = [
+        ErgGlobalSensor(coordinator, entry, description)
+        for description in GLOBAL_SENSORS
+    ]
 
-    # Subentry ID map (built in __init__.py before platform setup)
-    subentry_id_map = entry_data.get("_subentry_id_map", {})
+    job_entities = entry_data["job_entities"]
 
     # Migration: create job entities from pending migration data
     pending_jobs = entry_data.pop("pending_job_migration", None)
@@ -187,8 +163,7 @@ async def async_setup_entry(
             entity_id = job.get("entity_id", "")
             if entity_id.startswith("__"):
                 continue
-            job_entity = ErgJobEntity.from_job_dict(entry.entry_id, job)
-            entry_data["job_entities"][entity_id] = job_entity
+            job_entities[entity_id] = ErgJobEntity.from_job_dict(entry.entry_id, job)
 
         # Remove jobs from config options after migration
         new_opts = dict(entry.options)
@@ -198,41 +173,33 @@ async def async_setup_entry(
     # Restore job entities from entity registry (survives reload)
     registry = er.async_get(hass)
     job_prefix = f"{entry.entry_id}_job_"
-    for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
-        if not reg_entry.unique_id.startswith(job_prefix):
-            continue
-        sanitized = reg_entry.unique_id[len(job_prefix):]
-        entity_id = sanitized.replace("_", ".", 1)
-        if entity_id in entry_data["job_entities"]:
-            continue  # already created by migration
-        job_entity = ErgJobEntity(entry.entry_id, {"entity_id": entity_id})
-        entry_data["job_entities"][entity_id] = job_entity
-
-    # Group job entities + per-job sensors by subentry
-    no_subentry: list[SensorEntity] = []
-    by_subentry: dict[str, list[SensorEntity]] = {}
-    for entity_id in list(entry_data["job_entities"]):
-        if entity_id.startswith("__"):
-            continue
-        sid = subentry_id_map.get(entity_id)
-        job_entity = entry_data["job_entities"][entity_id]
+    prefix_len = len(job_prefix)
+    restored_ids = [
+        reg_entry.unique_id[prefix_len:].replace("_", ".", 1)
+        for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if reg_entry.unique_id.startswith(job_prefix)
+    ]
+    for entity_id in restored_ids:
+        if entity_id not in job_entities:  # else already created by migration
+            job_entities[entity_id] = ErgJobEntity(entry.entry_id, {"entity_id": entity_id})
+
+    # Group job entities + per-job sensors by subentry; global sensors go
+    # with the entities that have no subentry.
+    per_job_sensors = entry_data.setdefault("per_job_sensors", {})
+    by_subentry: defaultdict[str | None, list[SensorEntity]] = defaultdict(list)
+    by_subentry[None] = global_entities
+    for entity_id, job_entity, sid in public_job_items(entry_data):
         sensors = [
             ErgJobNextStartSensor(coordinator, entry, entity_id),
             ErgJobRunTimeSensor(coordinator, entry, entity_id),
             ErgJobEnergyCostSensor(coordinator, entry, entity_id),
         ]
-        entry_data.setdefault("per_job_sensors", {})[entity_id] = sensors
-        group = [job_entity] + sensors
-        if sid is None:
-            no_subentry.extend(group)
-        else:
-            by_subentry.setdefault(sid, []).extend(group)
+        per_job_sensors[entity_id] = sensors
+        bucket = by_subentry[sid]
+        bucket.append(job_entity)
+        bucket.extend(sensors)
 
-    # Add global + non-subentry entities
-    async_add_entities(global_entities + no_subentry)
-    # Add subentry-associated entities with their subentry ID
-    for sid, entities in by_subentry.items():
-        async_add_entities(entities, config_subentry_id=sid)
+    add_entities_by_subentry(async_add_entities, by_subentry)
 
 
 class ErgGlobalSensor(CoordinatorEntity, SensorEntity):
@@ -243,24 +210,25 @@ class ErgGlobalSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, entry: ConfigEntry, description: ErgSensorEntityDescription) -> None:
         super().__init__(coordinator)
         self._description = description
+        self._key = description.key
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{entry.entry_id}_erg_{description.key}"
+        self._attr_name = description.name
         self._entry = entry
-
-    @property
-    def name(self) -> str:
-        return self._description.name
+        # Populated by async_setup_entry before platforms are forwarded.
+        self._entry_data: dict[str, Any] = coordinator.hass.data[DOMAIN][entry.entry_id]
 
     @property
     def device_class(self):
-        return getattr(self._description, "device_class", None)
+        return self._description.device_class
 
     @property
     def state_class(self):
-        return getattr(self._description, "state_class", None)
+        return self._description.state_class
 
     @property
     def native_unit_of_measurement(self) -> str | None:
-        return getattr(self._description, "native_unit_of_measurement", None)
+        return self._description.native_unit_of_measurement
 
     @property
     def native_value(self):
@@ -268,25 +236,22 @@ class ErgGlobalSensor(CoordinatorEntity, SensorEntity):
         if data is None:
             return None
 
-        key = self._description.key
+        key = self._key
 
         if key == "next_job":
-            now = datetime.now().astimezone()
-            return _find_next_job_entity(data, now)
+            now = current_time(self.coordinator)
+            return _find_next_job_entity(self.coordinator, now)
 
         if key == "schedule_age":
             last = getattr(self.coordinator, "last_update_success_time", None)
             if last is None:
                 return None
-            now = datetime.now().astimezone()
+            now = current_time(self.coordinator)
             delta = now - last
             return round(delta.total_seconds() / 60, 1)
 
         if key == "schedule_view_url":
-            entry_data = self.coordinator.hass.data.get(DOMAIN, {}).get(
-                self._entry.entry_id, {}
-            )
-            base_url = entry_data.get("base_url")
+            base_url = self._entry_data.get("base_url")
             if base_url:
                 return f"{base_url}/api/v1/schedule/view"
             return None
@@ -294,111 +259,82 @@ class ErgGlobalSensor(CoordinatorEntity, SensorEntity):
         if key == "solve_status":
             return getattr(self.coordinator, "_last_solve_status", "unknown")
 
-        if self._description.value_fn is not None:
-            return self._description.value_fn(data)
+        if self._value_fn is not None:
+            return self._value_fn(data)
 
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        if self._description.key == "solve_status":
+        if self._key == "solve_status":
             error = getattr(self.coordinator, "_last_solve_error", "")
             return {"error": error} if error else None
 
-        if self._description.key != "battery_soc_forecast":
+        if self._key != "battery_soc_forecast":
             return None
         data = self.coordinator.data
         if data is None:
             return None
-        profile = data.get("battery_profile")
-        if not profile:
+        forecast = get_schedule_index(self.coordinator).battery_forecast
+        if forecast is None:
             return None
-        forecast = []
-        for entry in profile:
-            ts = entry.get("time")
-            soc = entry.get("soc_kwh")
-            if ts is None or soc is None:
-                continue
-            epoch_ms = int(datetime.fromisoformat(ts).timestamp() * 1000)
-            forecast.append([epoch_ms, soc])
         return {"forecast": forecast}
 
 
-def _get_assignment_for_entity(data: dict[str, Any], entity_id: str) -> dict[str, Any] | None:
-    """Find and aggregate all assignment dicts for a given entity_id.
-
-    Recurring jobs that span multiple days produce one assignment per day.
-    This merges them into a single dict so sensors report totals.
-    """
-    merged = None
-    for assignment in data.get("assignments") or []:
-        if assignment.get("entity") != entity_id:
-            continue
-        if merged is None:
-            merged = dict(assignment)
-            merged["slots"] = list(merged.get("slots") or [])
-        else:
-            merged["slots"].extend(assignment.get("slots") or [])
-            merged["run_time_seconds"] = (
-                merged.get("run_time_seconds", 0)
-                + assignment.get("run_time_seconds", 0)
-            )
-            merged["energy_cost"] = (
-                merged.get("energy_cost", 0)
-                + assignment.get("energy_cost", 0)
-            )
-    return merged
-
-
-class ErgJobNextStartSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the next scheduled start time for a job."""
+def _get_assignment_for_entity(coordinator: Any, entity_id: str) -> dict[str, Any] | None:
+    """Return the merged assignment dict for a given entity_id, or None."""
+    return get_schedule_index(coordinator).by_entity.get(entity_id)
+
+
+class _ErgJobSensorBase(CoordinatorEntity, SensorEntity):
+    """Base for per-job sensors that read the job's merged assignment."""
+
+    _unique_id_suffix: str
+    _name_label: str
 
     def __init__(self, coordinator, entry: ConfigEntry, entity_id: str) -> None:
         super().__init__(coordinator)
         self._entity_id = entity_id
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry.entry_id}_erg_{sanitized}_next_start"
+        self._attr_unique_id = (
+            f"{job_unique_id_prefix(entry.entry_id, entity_id)}_{self._unique_id_suffix}"
+        )
+        self._attr_name = f"Erg {self._name_label} \u2014 {friendly_name(entity_id)}"
+        self._attr_device_info = make_job_device_info(entity_id)
+
+    def _assignment(self) -> dict[str, Any] | None:
+        """Return this job's merged assignment, or None if not scheduled."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        return _get_assignment_for_entity(self.coordinator, self._entity_id)
 
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
 
-    @property
-    def name(self) -> str:
-        return f"Erg Next Start \u2014 {friendly_name(self._entity_id)}"
+class ErgJobNextStartSensor(_ErgJobSensorBase):
+    """Sensor showing the next scheduled start time for a job."""
+
+    _unique_id_suffix = "next_start"
+    _name_label = "Next Start"
 
     @property
     def native_value(self) -> str | None:
         data = self.coordinator.data
         if data is None:
             return None
-        assignment = _get_assignment_for_entity(data, self._entity_id)
-        if assignment is None:
+        table = get_schedule_index(self.coordinator).entity_slots.get(self._entity_id)
+        if table is None:
             return None
-        now = datetime.now().astimezone()
-        for slot_str in assignment.get("slots") or []:
-            slot_time = datetime.fromisoformat(slot_str)
-            if slot_time > now:
-                return slot_str
+        slot_times, slot_strs = table
+        pos = bisect_right(slot_times, current_time(self.coordinator))
+        if pos < len(slot_strs):
+            return slot_strs[pos]
         return None
 
 
-class ErgJobRunTimeSensor(CoordinatorEntity, SensorEntity):
+class ErgJobRunTimeSensor(_ErgJobSensorBase):
     """Sensor showing total run time in hours for a job."""
 
-    def __init__(self, coordinator, entry: ConfigEntry, entity_id: str) -> None:
-        super().__init__(coordinator)
-        self._entity_id = entity_id
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry.entry_id}_erg_{sanitized}_run_time"
-
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
-
-    @property
-    def name(self) -> str:
-        return f"Erg Run Time \u2014 {friendly_name(self._entity_id)}"
+    _unique_id_suffix = "run_time"
+    _name_label = "Run Time"
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -406,31 +342,17 @@ class ErgJobRunTimeSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        data = self.coordinator.data
-        if data is None:
-            return None
-        assignment = _get_assignment_for_entity(data, self._entity_id)
+        assignment = self._assignment()
         if assignment is None:
             return None
         return assignment.get("run_time_seconds", 0) / 3600
 
 
-class ErgJobEnergyCostSensor(CoordinatorEntity, SensorEntity):
+class ErgJobEnergyCostSensor(_ErgJobSensorBase):
     """Sensor showing energy cost for a job."""
 
-    def __init__(self, coordinator, entry: ConfigEntry, entity_id: str) -> None:
-        super().__init__(coordinator)
-        self._entity_id = entity_id
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry.entry_id}_erg_{sanitized}_energy_cost"
-
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
-
-    @property
-    def name(self) -> str:
-        return f"Erg Energy Cost \u2014 {friendly_name(self._entity_id)}"
+    _unique_id_suffix = "energy_cost"
+    _name_label = "Energy Cost"
 
     @property
     def device_class(self):
@@ -442,10 +364,7 @@ class ErgJobEnergyCostSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        data = self.coordinator.data
-        if data is None:
-            return None
-        assignment = _get_assignment_for_entity(data, self._entity_id)
+        assignment = self._assignment()
         if assignment is None:
             return None
         return assignment.get("energy_cost")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from types import MappingProxyType
 from typing import Any
 
@@ -26,6 +27,15 @@ from .text import create_job_texts
 
 _LOGGER = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
+class _EntryProxy:
+    """Stand-in for the ConfigEntry fields that per-job entities read."""
+
+    entry_id: str
+    options: dict[str, Any] = field(default_factory=dict)
+
+
 SERVICE_CREATE_JOB = "create_job"
 SERVICE_UPDATE_JOB = "update_job"
 SERVICE_DELETE_JOB = "delete_job"
@@ -88,12 +98,17 @@ DELETE_JOB_SCHEMA = vol.Schema(
 
 
 def _find_entry_data(hass: HomeAssistant) -> tuple[str, dict[str, Any]]:
-    """Find the first config entry data dict for the erg domain."""
-    domain_data = hass.data.get(DOMAIN, {})
-    for entry_id, entry_data in domain_data.items():
-        if isinstance(entry_data, dict) and "coordinator" in entry_data:
-            return entry_id, entry_data
-    raise ValueError("No Erg config entry found")
+    """Find the first config entry data dict for the erg domain.
+
+    hass.data[DOMAIN] only ever holds the per-entry dicts stored by
+    async_setup_entry, in setup order, so the first key is the entry that
+    was set up first.
+    """
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
+        raise ValueError("No Erg config entry found")
+    entry_id = next(iter(domain_data))
+    return entry_id, domain_data[entry_id]
 
 
 def create_job_entity(
@@ -252,11 +267,12 @@ def _create_per_job_entities(
     subentry_id: str | None = None,
 ) -> None:
     """Create per-job sensor, binary sensor, and control entities for a job."""
+    # Sensors need an entry with entry_id (and options, for the binary sensor)
+    entry_proxy = _EntryProxy(entry_id, entry_data.get("entry_options", {}))
+
     # Create per-job sensors (next_start, run_time, energy_cost)
     add_sensors_cb = entry_data.get("add_per_job_sensors")
     if add_sensors_cb:
-        # We need to pass a mock entry with entry_id for constructing sensors
-        entry_proxy = type("EntryProxy", (), {"entry_id": entry_id})()
         sensors = [
             ErgJobNextStartSensor(coordinator, entry_proxy, entity_id),
             ErgJobRunTimeSensor(coordinator, entry_proxy, entity_id),
@@ -268,10 +284,6 @@ def _create_per_job_entities(
     # Create per-job binary sensor (scheduled)
     add_binary_cb = entry_data.get("add_job_binary_sensors")
     if add_binary_cb:
-        entry_proxy = type("EntryProxy", (), {
-            "entry_id": entry_id,
-            "options": entry_data.get("entry_options", {}),
-        })()
         binary_sensors = [
             ErgScheduledBinarySensor(coordinator, entry_proxy, entity_id),
         ]
@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _seconds_str(seconds: int) -> str:
+    """Format whole seconds as a duration string like '3600s'.
+
+    Forecast periods are nearly always the same few lengths, so every box
+    in a refresh can share one string per length.
+    """
+    return f"{seconds}s"
+
+
 def solar_forecast_to_boxes(
     wh_hours: dict[str, float],
     horizon_start: datetime,
@@ -25,21 +37,25 @@ def solar_forecast_to_boxes(
     if not wh_hours:
         return []
 
-    # Parse timestamps once and map parsed datetimes directly to Wh values.
-    # This avoids isoformat() round-trip mismatches (e.g. "Z" vs "+00:00",
-    # trailing microsecond zeros) that would cause KeyError on lookup.
-    parsed: dict[datetime, float] = {
-        datetime.fromisoformat(ts): wh for ts, wh in wh_hours.items()
-    }
-    sorted_times = sorted(parsed.keys())
+    # Parse timestamps once and pair the parsed datetimes with their Wh
+    # values.  This avoids isoformat() round-trip mismatches (e.g. "Z" vs
+    # "+00:00", trailing microsecond zeros) that would cause KeyError on
+    # lookup.  Providers normally return periods in chronological order, so
+    # only dedupe and sort when they don't.
+    periods = [(datetime.fromisoformat(ts), wh) for ts, wh in wh_hours.items()]
+    if any(a[0] >= b[0] for a, b in zip(periods, periods[1:])):
+        # Out of order, or two strings naming the same instant (last wins).
+        periods = sorted(dict(periods).items())
     boxes: list[dict[str, Any]] = []
 
-    for i, period_start in enumerate(sorted_times):
-        # Determine period end from next timestamp, or assume 1h
-        if i + 1 < len(sorted_times):
-            period_end = sorted_times[i + 1]
-        else:
-            period_end = period_start + timedelta(hours=1)
+    # Each period ends at the next timestamp; the last one is assumed 1h.
+    # Timestamps are strictly increasing, so every period is non-empty.
+    period_ends = [p[0] for p in periods[1:]]
+    period_ends.append(periods[-1][0] + timedelta(hours=1))
+
+    for (period_start, wh), period_end in zip(periods, period_ends):
+        if wh <= 0:
+            continue
 
         # Clip to horizon
         effective_start = max(period_start, horizon_start)
@@ -47,22 +63,13 @@ def solar_forecast_to_boxes(
         if effective_end <= effective_start:
             continue
 
-        wh = parsed[period_start]
-        if wh <= 0:
-            continue
-
+        # Clipping scales energy and duration by the same factor, so the
+        # average power is the unclipped period's:
+        #   (wh * eff / period / 1000) / (eff / 3600) = wh * 3.6 / period
         period_seconds = (period_end - period_start).total_seconds()
-        if period_seconds <= 0:
-            continue
-
-        # Scale energy proportionally when the period is clipped to the horizon.
-        effective_seconds = (effective_end - effective_start).total_seconds()
-        effective_wh = wh * effective_seconds / period_seconds
-        effective_hours = effective_seconds / 3600
-        dc_kw = (effective_wh / 1000) / effective_hours  # Wh -> kWh -> kW average
+        dc_kw = wh * 3.6 / period_seconds  # Wh -> kW average
 
-        effective_duration = effective_end - effective_start
-        duration_str = f"{int(effective_duration.total_seconds())}s"
+        duration_str = _seconds_str(int((effective_end - effective_start).total_seconds()))
 
         boxes.append({
             "entity": "__solar__",
@@ -115,7 +122,7 @@ async def get_solar_forecast(
         hass, "energy", _register, wait_for_platforms=True
     )
 
-    merged: dict[str, float] = {}
+    merged: defaultdict[str, float] = defaultdict(float)
 
     if config_entry_ids is not None:
         entries = config_entry_ids
@@ -151,7 +158,10 @@ async def get_solar_forecast(
             continue
         if forecast is None:
             continue
-        for ts, wh in forecast.get("wh_hours", {}).items():
-            merged[ts] = merged.get(ts, 0) + wh
+        wh_hours = forecast.get("wh_hours")
+        if not wh_hours:
+            continue
+        for ts, wh in wh_hours.items():
+            merged[ts] += wh
 
-    return merged
+    return dict(merged)
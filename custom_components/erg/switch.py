@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -9,12 +10,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, friendly_name, make_job_device_info
-from .job_entities import ErgJobEntity
-
-
-def _sanitize_entity(entity_id: str) -> str:
-    return entity_id.replace(".", "_")
+from .const import DOMAIN, friendly_name, job_unique_id_prefix, make_job_device_info
+from .job_entities import ErgJobEntity, add_entities_by_subentry, public_job_items
 
 
 class ErgJobSwitch(SwitchEntity):
@@ -37,15 +34,11 @@ class ErgJobSwitch(SwitchEntity):
         self._coordinator = coordinator
         self._entity_id = entity_id
         self._attr_key = attr
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry_id}_erg_{sanitized}_{suffix}"
+        self._attr_unique_id = f"{job_unique_id_prefix(entry_id, entity_id)}_{suffix}"
         self._attr_name = f"Erg {name_suffix} \u2014 {friendly_name(entity_id)}"
+        self._attr_device_info = make_job_device_info(entity_id)
         self._attr_icon = icon
 
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
-
     @property
     def is_on(self) -> bool | None:
         return self._job_entity.extra_state_attributes.get(self._attr_key)
@@ -91,20 +84,12 @@ async def async_setup_entry(
 
     entry_data["add_job_switches"] = async_add_entities
 
-    subentry_id_map = entry_data.get("_subentry_id_map", {})
-    no_subentry: list[ErgJobSwitch] = []
-    by_subentry: dict[str, list[ErgJobSwitch]] = {}
-    for eid, job_entity in entry_data["job_entities"].items():
-        if eid.startswith("__"):
-            continue
-        sid = subentry_id_map.get(eid)
+    per_job_controls = entry_data.setdefault("per_job_controls", {})
+    by_subentry: defaultdict[str | None, list[ErgJobSwitch]] = defaultdict(list)
+    controls_for = per_job_controls.setdefault
+    for eid, job_entity, sid in public_job_items(entry_data):
         switches = create_job_switches(job_entity, coordinator, entry.entry_id, eid)
-        entry_data.setdefault("per_job_controls", {}).setdefault(eid, []).extend(switches)
-        if sid is None:
-            no_subentry.extend(switches)
-        else:
-            by_subentry.setdefault(sid, []).extend(switches)
-
-    async_add_entities(no_subentry)
-    for sid, entities in by_subentry.items():
-        async_add_entities(entities, config_subentry_id=sid)
+        controls_for(eid, []).extend(switches)
+        by_subentry[sid].extend(switches)
+
+    add_entities_by_subentry(async_add_entities, by_subentry)
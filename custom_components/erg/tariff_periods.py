@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, tzinfo
+from datetime import datetime, time, timedelta, tzinfo
 from typing import Any
 
-from .jobs import _parse_time, day_matches
+from .jobs import _parse_time, recurrence_weekdays
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -189,6 +189,20 @@ def expand_recurring_tariffs(
     current_day = horizon_start.date()
     end_day = horizon_end.date()
 
+    # Local midnight of every day in the horizon, with its weekday.  Built
+    # once and shared by all tariffs; each window is then one timedelta
+    # addition (same-tzinfo arithmetic is wall-clock, like combine()).
+    # An empty horizon gets no anchors, so every recurring tariff is skipped
+    # below before its entities are read; absolute periods still pass.
+    day_anchors: list[tuple[int, datetime]] = []
+    day = current_day
+    while day <= end_day and horizon_end > horizon_start:
+        day_anchors.append(
+            (day.weekday(), datetime.combine(day, time(), tzinfo=local_tz))
+        )
+        day += timedelta(days=1)
+    horizon_weekdays = frozenset(weekday for weekday, _ in day_anchors)
+
     # Pre-read entity forecasts (cache per entity to avoid repeated reads)
     entity_cache: dict[str, list[dict[str, Any]]] = {}
 
@@ -218,6 +232,13 @@ def expand_recurring_tariffs(
                 })
             continue
 
+        # Everything below is fixed per tariff; only the day varies.
+        weekdays = recurrence_weekdays(recurrence)
+        if weekdays.isdisjoint(horizon_weekdays):
+            # No day in the horizon can match (e.g. a weekdays-only tariff
+            # over a weekend horizon, or an empty horizon).
+            continue
+
         import_entity = tariff.get("import_price_entity", "")
         feedin_entity = tariff.get("feed_in_price_entity", "")
         has_entity = bool(import_entity or feedin_entity)
@@ -226,55 +247,63 @@ def expand_recurring_tariffs(
         import_forecasts = get_entity_forecasts(import_entity) if import_entity else []
         feedin_forecasts = get_entity_forecasts(feedin_entity) if feedin_entity else []
 
-        day = current_day
-        while day <= end_day:
-            if day_matches(day, recurrence):
-                window_start = datetime.combine(
-                    day, _parse_time(recurrence["time_window_start"])
-                ).replace(tzinfo=local_tz)
-                window_end = datetime.combine(
-                    day, _parse_time(recurrence["time_window_end"])
-                ).replace(tzinfo=local_tz)
-
-                # Overnight window wraps to next day
-                if window_end <= window_start:
-                    window_end += timedelta(days=1)
-
-                # Clip to horizon
-                effective_start = max(window_start, horizon_start)
-                effective_end = min(window_end, horizon_end)
-
-                if effective_end <= effective_start:
-                    day += timedelta(days=1)
-                    continue
-
-                if not has_entity:
-                    # Static tariff — single period for the whole window
-                    periods.append({
-                        "start": effective_start.isoformat(),
-                        "end": effective_end.isoformat(),
-                        "import_price": tariff.get("import_price", 0.0),
-                        "feed_in_price": tariff.get("feed_in_price", 0.0),
-                    })
-                else:
-                    # Entity-linked tariff — merge entity forecasts with
-                    # static fallback prices into fine-grained periods
-                    import_merged = _merge_entity_into_window(
-                        import_forecasts,
-                        effective_start,
-                        effective_end,
-                        tariff.get("import_price", 0.0),
-                    )
-                    feedin_merged = _merge_entity_into_window(
-                        feedin_forecasts,
-                        effective_start,
-                        effective_end,
-                        tariff.get("feed_in_price", 0.0),
-                    )
-                    periods.extend(
-                        _align_price_intervals(import_merged, feedin_merged)
-                    )
-
-            day += timedelta(days=1)
+        start_t = _parse_time(recurrence["time_window_start"])
+        end_t = _parse_time(recurrence["time_window_end"])
+        start_delta = timedelta(hours=start_t.hour, minutes=start_t.minute)
+        end_delta = timedelta(hours=end_t.hour, minutes=end_t.minute)
+        # Overnight window wraps to next day
+        if end_t <= start_t:
+            end_delta += timedelta(days=1)
+        import_price = tariff.get("import_price", 0.0)
+        feed_in_price = tariff.get("feed_in_price", 0.0)
+        # Static periods differ only in start/end; copy a per-tariff template
+        # (as expand_recurring_jobs does for boxes) to keep key order.
+        static_template = {
+            "start": None,
+            "end": None,
+            "import_price": import_price,
+            "feed_in_price": feed_in_price,
+        }
+
+        matching_days = [
+            midnight for weekday, midnight in day_anchors if weekday in weekdays
+        ]
+        for midnight in matching_days:
+            window_start = midnight + start_delta
+            window_end = midnight + end_delta
+
+            # Clip to horizon.  Conditional expressions rather than max/min:
+            # horizon and windows share local_tz, so each is one plain
+            # comparison without the builtin call.
+            effective_start = window_start if window_start >= horizon_start else horizon_start
+            effective_end = window_end if window_end <= horizon_end else horizon_end
+
+            if effective_end <= effective_start:
+                continue
+
+            if not has_entity:
+                # Static tariff — single period for the whole window
+                period = static_template.copy()
+                period["start"] = effective_start.isoformat()
+                period["end"] = effective_end.isoformat()
+                periods.append(period)
+            else:
+                # Entity-linked tariff — merge entity forecasts with
+                # static fallback prices into fine-grained periods
+                import_merged = _merge_entity_into_window(
+                    import_forecasts,
+                    effective_start,
+                    effective_end,
+                    import_price,
+                )
+                feedin_merged = _merge_entity_into_window(
+                    feedin_forecasts,
+                    effective_start,
+                    effective_end,
+                    feed_in_price,
+                )
+                periods.extend(
+                    _align_price_intervals(import_merged, feedin_merged)
+                )
 
     return periods
@@ -41,7 +41,6 @@ def _make_session(method: str, response):
 class TestHealthCheck:
     """Tests for ErgApiClient.health()."""
 
-    @pytest.mark.asyncio
     async def test_health_returns_true_on_200(self):
         resp = _make_response(200)
         session = _make_session("get", resp)
@@ -54,7 +53,6 @@ class TestHealthCheck:
             headers={"Content-Type": "application/json"},
         )
 
-    @pytest.mark.asyncio
     async def test_health_returns_false_on_500(self):
         resp = _make_response(500)
         session = _make_session("get", resp)
@@ -63,7 +61,6 @@ class TestHealthCheck:
         result = await client.health()
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_health_raises_auth_error_on_401(self):
         resp = _make_response(401)
         session = _make_session("get", resp)
@@ -72,7 +69,6 @@ class TestHealthCheck:
         with pytest.raises(ErgAuthError):
             await client.health()
 
-    @pytest.mark.asyncio
     async def test_health_raises_auth_error_on_403(self):
         resp = _make_response(403)
         session = _make_session("get", resp)
@@ -81,7 +77,6 @@ class TestHealthCheck:
         with pytest.raises(ErgAuthError):
             await client.health()
 
-    @pytest.mark.asyncio
     async def test_health_raises_connection_error(self):
         import aiohttp
 
@@ -99,7 +94,6 @@ class TestHealthCheck:
 class TestSchedule:
     """Tests for ErgApiClient.schedule()."""
 
-    @pytest.mark.asyncio
     async def test_schedule_returns_parsed_json(self):
         expected = {"assignments": [], "total_cost": 0}
         resp = _make_response(200, json_data=expected)
@@ -114,7 +108,6 @@ class TestSchedule:
         headers = call_kwargs[1]["headers"] if "headers" in call_kwargs[1] else call_kwargs[0][1]
         assert headers["Authorization"] == "Bearer secret"
 
-    @pytest.mark.asyncio
     async def test_schedule_raises_auth_error_on_401(self):
         resp = _make_response(401)
         session = _make_session("post", resp)
@@ -123,7 +116,6 @@ class TestSchedule:
         with pytest.raises(ErgAuthError):
             await client.schedule({})
 
-    @pytest.mark.asyncio
     async def test_schedule_raises_api_error_on_bad_status(self):
         from custom_components.erg.api import ErgApiError
 
@@ -134,7 +126,6 @@ class TestSchedule:
         with pytest.raises(ErgApiError, match="HTTP 500"):
             await client.schedule({})
 
-    @pytest.mark.asyncio
     async def test_schedule_raises_connection_error(self):
         import aiohttp
 
@@ -148,7 +139,6 @@ class TestSchedule:
         with pytest.raises(ErgConnectionError):
             await client.schedule({})
 
-    @pytest.mark.asyncio
     async def test_base_url_trailing_slash_stripped(self):
         resp = _make_response(200, json_data={})
         session = _make_session("post", resp)
@@ -163,7 +153,6 @@ class TestSchedule:
 class TestCreateApiKey:
     """Tests for ErgApiClient.create_api_key()."""
 
-    @pytest.mark.asyncio
     async def test_create_api_key_success(self):
         key_data = {"id": 1, "token": "erg_key_abc123", "scope": "schedule"}
         resp = _make_response(200, json_data=key_data)
@@ -173,7 +162,6 @@ class TestCreateApiKey:
         result = await client.create_api_key("Test Key", "schedule")
         assert result == key_data
 
-    @pytest.mark.asyncio
     async def test_create_api_key_returns_none_on_404(self):
         resp = _make_response(404)
         session = _make_session("post", resp)
@@ -182,7 +170,6 @@ class TestCreateApiKey:
         result = await client.create_api_key("Test Key")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_create_api_key_raises_auth_error(self):
         resp = _make_response(401)
         session = _make_session("post", resp)
@@ -191,7 +178,6 @@ class TestCreateApiKey:
         with pytest.raises(ErgAuthError):
             await client.create_api_key("Test Key")
 
-    @pytest.mark.asyncio
     async def test_create_api_key_raises_on_server_error(self):
         from custom_components.erg.api import ErgApiError
 
@@ -206,7 +192,6 @@ class TestCreateApiKey:
 class TestDeleteApiKey:
     """Tests for ErgApiClient.delete_api_key()."""
 
-    @pytest.mark.asyncio
     async def test_delete_api_key_success(self):
         resp = _make_response(200, json_data={"status": "revoked"})
         session = _make_session("delete", resp)
@@ -216,7 +201,6 @@ class TestDeleteApiKey:
         assert result is True
         session.delete.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete_api_key_returns_false_on_404(self):
         resp = _make_response(404)
         session = _make_session("delete", resp)
@@ -225,7 +209,6 @@ class TestDeleteApiKey:
         result = await client.delete_api_key(99)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_delete_api_key_raises_auth_error(self):
         resp = _make_response(401)
         session = _make_session("delete", resp)
@@ -238,7 +221,6 @@ class TestDeleteApiKey:
 class TestGetAemoTariff:
     """Tests for ErgApiClient.get_aemo_tariff()."""
 
-    @pytest.mark.asyncio
     async def test_get_aemo_tariff_success(self):
         periods = [
             {"start": "2026-03-03T00:30:00Z", "end": "2026-03-03T01:00:00Z",
@@ -255,7 +237,6 @@ class TestGetAemoTariff:
         result = await client.get_aemo_tariff("NSW1")
         assert result == periods
 
-    @pytest.mark.asyncio
     async def test_get_aemo_tariff_returns_none_on_404(self):
         resp = _make_response(404)
         session = _make_session("get", resp)
@@ -264,7 +245,6 @@ class TestGetAemoTariff:
         result = await client.get_aemo_tariff("NSW1")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_aemo_tariff_returns_none_on_503(self):
         resp = _make_response(503)
         session = _make_session("get", resp)
@@ -273,7 +253,6 @@ class TestGetAemoTariff:
         result = await client.get_aemo_tariff("NSW1")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_aemo_tariff_raises_auth_error(self):
         resp = _make_response(401)
         session = _make_session("get", resp)
@@ -286,7 +265,6 @@ class TestGetAemoTariff:
 class TestSubmitScheduleAsync:
     """Tests for ErgApiClient.submit_schedule_async()."""
 
-    @pytest.mark.asyncio
     async def test_submit_schedule_async_success(self):
         expected = {"job_id": "abc123", "status": "pending"}
         resp = _make_response(202, json_data=expected)
@@ -296,7 +274,6 @@ class TestSubmitScheduleAsync:
         result = await client.submit_schedule_async({"system": {}, "boxes": []})
         assert result == expected
 
-    @pytest.mark.asyncio
     async def test_submit_schedule_async_not_supported(self):
         resp = _make_response(404)
         session = _make_session("post", resp)
@@ -305,7 +282,6 @@ class TestSubmitScheduleAsync:
         result = await client.submit_schedule_async({"system": {}, "boxes": []})
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_submit_schedule_async_auth_error(self):
         resp = _make_response(401)
         session = _make_session("post", resp)
@@ -314,7 +290,6 @@ class TestSubmitScheduleAsync:
         with pytest.raises(ErgAuthError):
             await client.submit_schedule_async({})
 
-    @pytest.mark.asyncio
     async def test_submit_schedule_async_server_error(self):
         from custom_components.erg.api import ErgApiError
 
@@ -329,7 +304,6 @@ class TestSubmitScheduleAsync:
 class TestGetScheduleJob:
     """Tests for ErgApiClient.get_schedule_job()."""
 
-    @pytest.mark.asyncio
     async def test_get_schedule_job_complete(self):
         expected = {
             "job_id": "abc123",
@@ -343,7 +317,6 @@ class TestGetScheduleJob:
         result = await client.get_schedule_job("abc123")
         assert result == expected
 
-    @pytest.mark.asyncio
     async def test_get_schedule_job_not_found(self):
         from custom_components.erg.api import ErgApiError
 
@@ -354,7 +327,6 @@ class TestGetScheduleJob:
         with pytest.raises(ErgApiError, match="Job not found"):
             await client.get_schedule_job("nonexistent")
 
-    @pytest.mark.asyncio
     async def test_get_schedule_job_auth_error(self):
         resp = _make_response(401)
         session = _make_session("get", resp)
@@ -363,7 +335,6 @@ class TestGetScheduleJob:
         with pytest.raises(ErgAuthError):
             await client.get_schedule_job("abc123")
 
-    @pytest.mark.asyncio
     async def test_get_schedule_job_server_error(self):
         from custom_components.erg.api import ErgApiError
 
@@ -18,14 +18,28 @@ from custom_components.erg.binary_sensor import (
     async_setup_entry,
 )
 from custom_components.erg.const import DOMAIN
+from custom_components.erg.job_entities import ErgJobEntity
 
 
 AEST = timezone(timedelta(hours=10))
 
+# One 5-minute pool pump slot at 10:00, read by the
+# _is_entity_scheduled_now single-slot cases.
+_POOL_PUMP_DATA = {
+    "assignments": [
+        {
+            "entity": "switch.pool_pump",
+            "slots": ["2025-01-15T10:00:00+10:00"],
+        },
+    ]
+}
 
-def _make_coordinator(data=None):
+
+def _make_coordinator(data=None, update_now=None):
     coordinator = MagicMock()
     coordinator.data = data
+    coordinator.update_now = update_now
+    coordinator.schedule_index = None
     return coordinator
 
 
@@ -39,71 +53,21 @@ def _make_entry(entry_id="test_entry", options=None):
 class TestIsEntityScheduledNow:
     """Tests for _is_entity_scheduled_now helper."""
 
-    def test_returns_true_when_now_in_slot(self):
-        data = {
-            "assignments": [
-                {
-                    "entity": "switch.pool_pump",
-                    "slots": ["2025-01-15T10:00:00+10:00"],
-                },
-            ]
-        }
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
+    @pytest.mark.parametrize(
+        ("now", "entity_id", "expected"),
+        [
+            (datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST), "switch.pool_pump", True),
+            (datetime(2025, 1, 15, 10, 6, 0, tzinfo=AEST), "switch.pool_pump", False),
+            (datetime(2025, 1, 15, 9, 59, 0, tzinfo=AEST), "switch.pool_pump", False),
+            # Exactly at slot end (10:05:00): the interval is half-open
+            (datetime(2025, 1, 15, 10, 5, 0, tzinfo=AEST), "switch.pool_pump", False),
+            (datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST), "switch.ev_charger", False),
+        ],
+        ids=["in_slot", "after_slot", "before_slot", "slot_end_excluded", "different_entity"],
+    )
+    def test_single_slot(self, now, entity_id, expected):
         slot_duration = timedelta(minutes=5)
-        assert _is_entity_scheduled_now(data, "switch.pool_pump", now, slot_duration) is True
-
-    def test_returns_false_when_now_after_slot(self):
-        data = {
-            "assignments": [
-                {
-                    "entity": "switch.pool_pump",
-                    "slots": ["2025-01-15T10:00:00+10:00"],
-                },
-            ]
-        }
-        now = datetime(2025, 1, 15, 10, 6, 0, tzinfo=AEST)
-        slot_duration = timedelta(minutes=5)
-        assert _is_entity_scheduled_now(data, "switch.pool_pump", now, slot_duration) is False
-
-    def test_returns_false_when_now_before_slot(self):
-        data = {
-            "assignments": [
-                {
-                    "entity": "switch.pool_pump",
-                    "slots": ["2025-01-15T10:00:00+10:00"],
-                },
-            ]
-        }
-        now = datetime(2025, 1, 15, 9, 59, 0, tzinfo=AEST)
-        slot_duration = timedelta(minutes=5)
-        assert _is_entity_scheduled_now(data, "switch.pool_pump", now, slot_duration) is False
-
-    def test_half_open_interval_excludes_end(self):
-        data = {
-            "assignments": [
-                {
-                    "entity": "switch.pool_pump",
-                    "slots": ["2025-01-15T10:00:00+10:00"],
-                },
-            ]
-        }
-        # Exactly at slot end (10:05:00) should be False
-        now = datetime(2025, 1, 15, 10, 5, 0, tzinfo=AEST)
-        slot_duration = timedelta(minutes=5)
-        assert _is_entity_scheduled_now(data, "switch.pool_pump", now, slot_duration) is False
-
-    def test_returns_false_for_different_entity(self):
-        data = {
-            "assignments": [
-                {
-                    "entity": "switch.pool_pump",
-                    "slots": ["2025-01-15T10:00:00+10:00"],
-                },
-            ]
-        }
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        slot_duration = timedelta(minutes=5)
-        assert _is_entity_scheduled_now(data, "switch.ev_charger", now, slot_duration) is False
+        assert _is_entity_scheduled_now(_make_coordinator(_POOL_PUMP_DATA), entity_id, now, slot_duration) is expected
 
     def test_returns_true_for_second_slot(self):
         data = {
@@ -119,7 +83,7 @@ class TestIsEntityScheduledNow:
         }
         now = datetime(2025, 1, 15, 10, 7, 0, tzinfo=AEST)
         slot_duration = timedelta(minutes=5)
-        assert _is_entity_scheduled_now(data, "switch.pool_pump", now, slot_duration) is True
+        assert _is_entity_scheduled_now(_make_coordinator(data), "switch.pool_pump", now, slot_duration) is True
 
 
 class TestErgScheduledBinarySensor:
@@ -154,13 +118,11 @@ class TestErgScheduledBinarySensor:
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
-    @pytest.mark.asyncio
     async def test_creates_one_sensor_per_job_entity(self):
         coordinator = _make_coordinator()
         entry = _make_entry()
         hass = MagicMock()
 
-        from custom_components.erg.job_entities import ErgJobEntity
         job1 = ErgJobEntity(entry.entry_id, {"entity_id": "switch.pool_pump", "job_type": "recurring"})
         job2 = ErgJobEntity(entry.entry_id, {"entity_id": "switch.ev_charger", "job_type": "recurring"})
 
@@ -179,13 +141,11 @@ class TestAsyncSetupEntry:
         # 2 per-job + 2 global (force charge, force discharge)
         assert len(added) == 4
 
-    @pytest.mark.asyncio
     async def test_filters_dunder_entities(self):
         coordinator = _make_coordinator()
         entry = _make_entry()
         hass = MagicMock()
 
-        from custom_components.erg.job_entities import ErgJobEntity
         job1 = ErgJobEntity(entry.entry_id, {"entity_id": "switch.pool_pump", "job_type": "recurring"})
         job2 = ErgJobEntity(entry.entry_id, {"entity_id": "__solar__", "job_type": "recurring"})
 
@@ -204,7 +164,6 @@ class TestAsyncSetupEntry:
         # 1 per-job + 2 global
         assert len(added) == 3
 
-    @pytest.mark.asyncio
     async def test_no_entities_when_no_jobs(self):
         coordinator = _make_coordinator()
         entry = _make_entry()
@@ -221,13 +180,11 @@ class TestAsyncSetupEntry:
         # 0 per-job + 2 global
         assert len(added) == 2
 
-    @pytest.mark.asyncio
     async def test_creates_global_battery_sensors(self):
         coordinator = _make_coordinator()
         entry = _make_entry()
         hass = MagicMock()
 
-        from custom_components.erg.job_entities import ErgJobEntity
         job1 = ErgJobEntity(entry.entry_id, {"entity_id": "switch.pool_pump", "job_type": "recurring"})
 
         entry_data = {
@@ -254,7 +211,7 @@ class TestGetCurrentGridPower:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_current_grid_power(data, now, timedelta(minutes=5)) == (3.0, 0.0)
+        assert _get_current_grid_power(_make_coordinator(data), now, timedelta(minutes=5)) == (3.0, 0.0)
 
     def test_returns_zeros_when_no_matching_slot(self):
         data = {
@@ -263,12 +220,12 @@ class TestGetCurrentGridPower:
             ]
         }
         now = datetime(2025, 1, 15, 11, 0, 0, tzinfo=AEST)
-        assert _get_current_grid_power(data, now, timedelta(minutes=5)) == (0.0, 0.0)
+        assert _get_current_grid_power(_make_coordinator(data), now, timedelta(minutes=5)) == (0.0, 0.0)
 
     def test_returns_zeros_when_no_battery_profile(self):
         data = {}
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_current_grid_power(data, now, timedelta(minutes=5)) == (0.0, 0.0)
+        assert _get_current_grid_power(_make_coordinator(data), now, timedelta(minutes=5)) == (0.0, 0.0)
 
     def test_half_open_interval_excludes_end(self):
         data = {
@@ -277,7 +234,7 @@ class TestGetCurrentGridPower:
             ]
         }
         now = datetime(2025, 1, 15, 10, 5, 0, tzinfo=AEST)
-        assert _get_current_grid_power(data, now, timedelta(minutes=5)) == (0.0, 0.0)
+        assert _get_current_grid_power(_make_coordinator(data), now, timedelta(minutes=5)) == (0.0, 0.0)
 
 
 class TestGetRunningLoadAC:
@@ -291,7 +248,7 @@ class TestGetRunningLoadAC:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_load_ac(data, now, timedelta(minutes=5)) == 9.0
+        assert _get_running_load_ac(_make_coordinator(data), now, timedelta(minutes=5)) == 9.0
 
     def test_excludes_dunder_entities(self):
         data = {
@@ -301,7 +258,7 @@ class TestGetRunningLoadAC:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_load_ac(data, now, timedelta(minutes=5)) == 2.0
+        assert _get_running_load_ac(_make_coordinator(data), now, timedelta(minutes=5)) == 2.0
 
     def test_excludes_jobs_not_in_current_slot(self):
         data = {
@@ -310,12 +267,12 @@ class TestGetRunningLoadAC:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_load_ac(data, now, timedelta(minutes=5)) == 0.0
+        assert _get_running_load_ac(_make_coordinator(data), now, timedelta(minutes=5)) == 0.0
 
     def test_returns_zero_when_no_assignments(self):
         data = {}
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_load_ac(data, now, timedelta(minutes=5)) == 0.0
+        assert _get_running_load_ac(_make_coordinator(data), now, timedelta(minutes=5)) == 0.0
 
 
 class TestGetRunningSolarDC:
@@ -328,7 +285,7 @@ class TestGetRunningSolarDC:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_solar_dc(data, now, timedelta(minutes=5)) == 3.0
+        assert _get_running_solar_dc(_make_coordinator(data), now, timedelta(minutes=5)) == 3.0
 
     def test_ignores_non_solar_entities(self):
         data = {
@@ -338,7 +295,7 @@ class TestGetRunningSolarDC:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_solar_dc(data, now, timedelta(minutes=5)) == 3.0
+        assert _get_running_solar_dc(_make_coordinator(data), now, timedelta(minutes=5)) == 3.0
 
     def test_returns_zero_when_solar_not_in_slot(self):
         data = {
@@ -347,7 +304,7 @@ class TestGetRunningSolarDC:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_solar_dc(data, now, timedelta(minutes=5)) == 0.0
+        assert _get_running_solar_dc(_make_coordinator(data), now, timedelta(minutes=5)) == 0.0
 
     def test_returns_zero_when_no_solar(self):
         data = {
@@ -356,7 +313,32 @@ class TestGetRunningSolarDC:
             ]
         }
         now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        assert _get_running_solar_dc(data, now, timedelta(minutes=5)) == 0.0
+        assert _get_running_solar_dc(_make_coordinator(data), now, timedelta(minutes=5)) == 0.0
+
+
+_POOL_PUMP_2KW = {
+    "entity": "switch.pool_pump", "ac_power": 2.0, "slots": ["2025-01-15T10:00:00+10:00"],
+}
+_SOLAR_3KW = {
+    "entity": "__solar__", "dc_power": -3.0, "slots": ["2025-01-15T10:00:00+10:00"],
+}
+
+
+def _force_data(grid_import, grid_export, assignments):
+    return {
+        "battery_profile": [
+            {
+                "time": "2025-01-15T10:00:00+10:00",
+                "grid_import": grid_import,
+                "grid_export": grid_export,
+            },
+        ],
+        "assignments": assignments,
+    }
+
+
+# 10:02 AEST, inside the 10:00 slot of _force_data()
+FORCE_NOW = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
 
 
 class TestErgForceChargeSensor:
@@ -380,81 +362,49 @@ class TestErgForceChargeSensor:
         sensor = ErgForceChargeSensor(coordinator, entry)
         assert sensor.is_on is None
 
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_true_when_grid_import_exceeds_loads(self, mock_dt):
-        """grid_import=5kW, load=2kW → 3kW excess charges battery."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
-
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 5.0, "grid_export": 0.0},
-            ],
-            "assignments": [
-                {"entity": "switch.pool_pump", "ac_power": 2.0, "slots": ["2025-01-15T10:00:00+10:00"]},
-            ],
-        }
-        coordinator = _make_coordinator(data=data)
-        entry = _make_entry(options={"slot_duration": "5m"})
-        sensor = ErgForceChargeSensor(coordinator, entry)
-        assert sensor.is_on is True
-
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_false_when_grid_import_equals_loads(self, mock_dt):
-        """grid_import=2kW, load=2kW → no excess, just powering loads."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
-
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 2.0, "grid_export": 0.0},
-            ],
-            "assignments": [
-                {"entity": "switch.pool_pump", "ac_power": 2.0, "slots": ["2025-01-15T10:00:00+10:00"]},
-            ],
-        }
-        coordinator = _make_coordinator(data=data)
+    @pytest.mark.parametrize(
+        ("grid_import", "grid_export", "assignments", "expected"),
+        [
+            # 5kW import, 2kW load → 3kW excess charges battery
+            (5.0, 0.0, [_POOL_PUMP_2KW], True),
+            # 2kW import, 2kW load → no excess, just powering loads
+            (2.0, 0.0, [_POOL_PUMP_2KW], False),
+            # 3kW import, no loads → all import charges battery
+            (3.0, 0.0, [], True),
+            # no import → no charging from grid
+            (0.0, 2.0, [], False),
+        ],
+        ids=["import_exceeds_loads", "import_equals_loads", "no_loads", "no_import"],
+    )
+    def test_is_on(self, grid_import, grid_export, assignments, expected):
+        coordinator = _make_coordinator(
+            data=_force_data(grid_import, grid_export, assignments),
+            update_now=FORCE_NOW,
+        )
         entry = _make_entry(options={"slot_duration": "5m"})
         sensor = ErgForceChargeSensor(coordinator, entry)
-        assert sensor.is_on is False
-
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_true_when_no_loads_but_grid_import(self, mock_dt):
-        """grid_import=3kW, no loads → all import charges battery."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
+        assert sensor.is_on is expected
 
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 3.0, "grid_export": 0.0},
-            ],
-            "assignments": [],
-        }
-        coordinator = _make_coordinator(data=data)
+    def test_is_on_reused_within_one_push(self):
+        coordinator = _make_coordinator(
+            data=_force_data(5.0, 0.0, []), update_now=FORCE_NOW
+        )
         entry = _make_entry(options={"slot_duration": "5m"})
         sensor = ErgForceChargeSensor(coordinator, entry)
-        assert sensor.is_on is True
-
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_false_when_no_grid_import(self, mock_dt):
-        """grid_import=0 → no charging from grid."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
-
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 0.0, "grid_export": 2.0},
-            ],
-            "assignments": [],
-        }
-        coordinator = _make_coordinator(data=data)
-        entry = _make_entry(options={"slot_duration": "5m"})
-        sensor = ErgForceChargeSensor(coordinator, entry)
-        assert sensor.is_on is False
+        with patch(
+            "custom_components.erg.binary_sensor._get_current_grid_power",
+            wraps=_get_current_grid_power,
+        ) as grid_power:
+            assert sensor.is_on is True
+            assert sensor.is_on is True
+            assert grid_power.call_count == 1
+
+            # A later push, or a new schedule, recomputes
+            coordinator.update_now = FORCE_NOW + timedelta(minutes=5)
+            assert sensor.is_on is False
+            coordinator.data = _force_data(5.0, 0.0, [])
+            sensor.is_on
+            assert grid_power.call_count == 3
 
 
 class TestErgForceDischargeSensor:
@@ -478,80 +428,25 @@ class TestErgForceDischargeSensor:
         sensor = ErgForceDischargeSensor(coordinator, entry)
         assert sensor.is_on is None
 
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_true_when_export_exceeds_solar(self, mock_dt):
-        """grid_export=5kW, solar_dc=3kW → 2kW from battery."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
-
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 0.0, "grid_export": 5.0},
-            ],
-            "assignments": [
-                {"entity": "__solar__", "dc_power": -3.0, "slots": ["2025-01-15T10:00:00+10:00"]},
-            ],
-        }
-        coordinator = _make_coordinator(data=data)
-        entry = _make_entry(options={"slot_duration": "5m"})
-        sensor = ErgForceDischargeSensor(coordinator, entry)
-        assert sensor.is_on is True
-
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_false_when_export_equals_solar(self, mock_dt):
-        """grid_export=3kW, solar_dc=3kW → just solar export."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
-
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 0.0, "grid_export": 3.0},
-            ],
-            "assignments": [
-                {"entity": "__solar__", "dc_power": -3.0, "slots": ["2025-01-15T10:00:00+10:00"]},
-            ],
-        }
-        coordinator = _make_coordinator(data=data)
-        entry = _make_entry(options={"slot_duration": "5m"})
-        sensor = ErgForceDischargeSensor(coordinator, entry)
-        assert sensor.is_on is False
-
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_true_when_export_with_no_solar(self, mock_dt):
-        """grid_export=2kW, no solar → all from battery."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
-
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 0.0, "grid_export": 2.0},
-            ],
-            "assignments": [],
-        }
-        coordinator = _make_coordinator(data=data)
-        entry = _make_entry(options={"slot_duration": "5m"})
-        sensor = ErgForceDischargeSensor(coordinator, entry)
-        assert sensor.is_on is True
-
-    @patch("custom_components.erg.binary_sensor.datetime")
-    def test_is_on_false_when_no_export(self, mock_dt):
-        """grid_export=0 → no discharge to grid."""
-        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=AEST)
-        mock_dt.now.return_value.astimezone.return_value = now
-        mock_dt.fromisoformat = datetime.fromisoformat
-
-        data = {
-            "battery_profile": [
-                {"time": "2025-01-15T10:00:00+10:00", "grid_import": 3.0, "grid_export": 0.0},
-            ],
-            "assignments": [
-                {"entity": "__solar__", "dc_power": -3.0, "slots": ["2025-01-15T10:00:00+10:00"]},
-            ],
-        }
-        coordinator = _make_coordinator(data=data)
+    @pytest.mark.parametrize(
+        ("grid_import", "grid_export", "assignments", "expected"),
+        [
+            # 5kW export, 3kW solar → 2kW from battery
+            (0.0, 5.0, [_SOLAR_3KW], True),
+            # 3kW export, 3kW solar → just solar export
+            (0.0, 3.0, [_SOLAR_3KW], False),
+            # 2kW export, no solar → all from battery
+            (0.0, 2.0, [], True),
+            # no export → no discharge to grid
+            (3.0, 0.0, [_SOLAR_3KW], False),
+        ],
+        ids=["export_exceeds_solar", "export_equals_solar", "no_solar", "no_export"],
+    )
+    def test_is_on(self, grid_import, grid_export, assignments, expected):
+        coordinator = _make_coordinator(
+            data=_force_data(grid_import, grid_export, assignments),
+            update_now=FORCE_NOW,
+        )
         entry = _make_entry(options={"slot_duration": "5m"})
         sensor = ErgForceDischargeSensor(coordinator, entry)
-        assert sensor.is_on is False
+        assert sensor.is_on is expected
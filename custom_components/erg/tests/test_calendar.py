@@ -5,8 +5,6 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
-import pytest
-
 from custom_components.erg.calendar import (
     ErgScheduleCalendar,
     _friendly_name,
@@ -17,9 +15,11 @@ from custom_components.erg.calendar import (
 AEST = timezone(timedelta(hours=10))
 
 
-def _make_coordinator(data=None):
+def _make_coordinator(data=None, update_now=None):
     coordinator = MagicMock()
     coordinator.data = data
+    coordinator.update_now = update_now
+    coordinator.schedule_index = None
     return coordinator
 
 
@@ -168,14 +168,10 @@ class TestErgScheduleCalendar:
                 },
             ]
         }
-        coordinator = _make_coordinator(data=data)
+        coordinator = _make_coordinator(data=data, update_now=now)
         entry = _make_entry(options={"slot_duration": "5m"})
         cal = ErgScheduleCalendar(coordinator, entry)
-
-        with patch("custom_components.erg.calendar.datetime") as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.fromisoformat = datetime.fromisoformat
-            event = cal.event
+        event = cal.event
 
         assert event is not None
         assert event.summary == "Pool Pump"
@@ -193,18 +189,13 @@ class TestErgScheduleCalendar:
                 },
             ]
         }
-        coordinator = _make_coordinator(data=data)
+        coordinator = _make_coordinator(data=data, update_now=now)
         entry = _make_entry(options={"slot_duration": "5m"})
         cal = ErgScheduleCalendar(coordinator, entry)
-
-        with patch("custom_components.erg.calendar.datetime") as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.fromisoformat = datetime.fromisoformat
-            event = cal.event
+        event = cal.event
 
         assert event is None
 
-    @pytest.mark.asyncio
     async def test_async_get_events_filters_by_range(self):
         data = {
             "assignments": [
@@ -233,11 +224,57 @@ class TestErgScheduleCalendar:
         assert len(events) == 1
         assert events[0].start == datetime(2025, 1, 15, 14, 0, 0, tzinfo=AEST)
 
+    async def test_async_get_events_includes_long_event_spanning_range(self):
+        """A long event that started before a shorter one still overlaps."""
+        data = {
+            "assignments": [
+                {
+                    "entity": "switch.ev_charger",
+                    "slots": [f"2025-01-15T{h:02d}:00:00+10:00" for h in range(8, 16)],
+                },
+                {
+                    "entity": "switch.pool_pump",
+                    "slots": ["2025-01-15T09:00:00+10:00"],
+                },
+                {
+                    "entity": "switch.heater",
+                    "slots": ["2025-01-15T16:00:00+10:00"],
+                },
+            ]
+        }
+        coordinator = _make_coordinator(data=data)
+        entry = _make_entry(options={"slot_duration": "1h"})
+        cal = ErgScheduleCalendar(coordinator, entry)
+
+        start = datetime(2025, 1, 15, 12, 0, 0, tzinfo=AEST)
+        end = datetime(2025, 1, 15, 13, 0, 0, tzinfo=AEST)
+        events = await cal.async_get_events(MagicMock(), start, end)
+        assert [ev.summary for ev in events] == ["Ev Charger"]
+
+        coordinator.update_now = start
+        assert cal.event.summary == "Ev Charger"
+
+    async def test_events_built_once_per_schedule(self):
+        data = {"assignments": [{"entity": "switch.pool_pump", "slots": ["2025-01-15T10:00:00+10:00"]}]}
+        coordinator = _make_coordinator(data=data)
+        entry = _make_entry(options={"slot_duration": "5m"})
+        cal = ErgScheduleCalendar(coordinator, entry)
+        start = datetime(2025, 1, 15, 0, 0, 0, tzinfo=AEST)
+        end = datetime(2025, 1, 16, 0, 0, 0, tzinfo=AEST)
+
+        with patch.object(cal, "_build_events", wraps=cal._build_events) as build:
+            await cal.async_get_events(MagicMock(), start, end)
+            await cal.async_get_events(MagicMock(), start, end)
+            assert build.call_count == 1
+
+            coordinator.data = {"assignments": []}
+            assert await cal.async_get_events(MagicMock(), start, end) == []
+            assert build.call_count == 2
+
 
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
-    @pytest.mark.asyncio
     async def test_creates_one_calendar_entity(self):
         coordinator = _make_coordinator()
         entry = _make_entry()
@@ -18,23 +18,29 @@ from custom_components.erg.config_flow import (
 
 
 class TestParseDaysOfWeekStr:
-    def test_empty_string(self):
-        assert _parse_days_of_week_str("") == []
-
-    def test_whitespace_only(self):
-        assert _parse_days_of_week_str("   ") == []
-
-    def test_single_day(self):
-        assert _parse_days_of_week_str("3") == [3]
-
-    def test_multiple_days(self):
-        assert _parse_days_of_week_str("0,2,4") == [0, 2, 4]
-
-    def test_with_spaces(self):
-        assert _parse_days_of_week_str(" 1 , 3 , 5 ") == [1, 3, 5]
-
-    def test_ignores_non_digit(self):
-        assert _parse_days_of_week_str("0,abc,4") == [0, 4]
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("", []),
+            ("   ", []),
+            ("3", [3]),
+            ("0,2,4", [0, 2, 4]),
+            (" 1 , 3 , 5 ", [1, 3, 5]),
+            ("0,abc,4", [0, 4]),
+            ("1 2,3", [3]),
+        ],
+        ids=[
+            "empty",
+            "whitespace_only",
+            "single_day",
+            "multiple_days",
+            "with_spaces",
+            "ignores_non_digit",
+            "inner_space_not_joined",
+        ],
+    )
+    def test_parses(self, value, expected):
+        assert _parse_days_of_week_str(value) == expected
 
 
 # ── _build_tariff_dict ───────────────────────────────────────────────────
@@ -100,6 +106,16 @@ class TestSchemaBuilders:
         assert "import_price" in keys
         assert "frequency" in keys
 
+    def test_tariff_schema_defaults_shared(self):
+        assert _tariff_schema() is _tariff_schema()
+
+    def test_tariff_schema_with_defaults_rebuilt(self):
+        tariff = {
+            "name": "Peak",
+            "recurrence": {"frequency": "custom", "days_of_week": [1, 3]},
+        }
+        assert _tariff_schema(tariff) is not _tariff_schema()
+
 
 # ── Flow navigation tests (mocked HA) ───────────────────────────────────
 
@@ -141,14 +157,12 @@ def _make_options_flow(
 
 
 class TestOptionsFlowNavigation:
-    @pytest.mark.asyncio
     async def test_init_shows_form_when_no_input(self):
         flow = _make_options_flow()
         result = await flow.async_step_init(user_input=None)
         assert result["type"] == "form"
         assert result["step_id"] == "init"
 
-    @pytest.mark.asyncio
     async def test_init_with_input_advances_to_scheduling(self):
         flow = _make_options_flow({"tariff_periods": []})
         result = await flow.async_step_init(
@@ -157,7 +171,6 @@ class TestOptionsFlowNavigation:
         assert result["type"] == "form"
         assert result["step_id"] == "scheduling"
 
-    @pytest.mark.asyncio
     async def test_scheduling_with_input_advances_to_advanced(self):
         flow = _make_options_flow({"tariff_periods": []})
         flow._system_opts = {"grid_import_limit": 10.0}
@@ -167,7 +180,6 @@ class TestOptionsFlowNavigation:
         assert result["type"] == "form"
         assert result["step_id"] == "advanced"
 
-    @pytest.mark.asyncio
     async def test_advanced_with_input_advances_to_tariffs_menu(self):
         flow = _make_options_flow({"tariff_periods": []})
         flow._system_opts = {"grid_import_limit": 10.0}
@@ -177,21 +189,18 @@ class TestOptionsFlowNavigation:
         assert result["type"] == "form"
         assert result["step_id"] == "tariffs_menu"
 
-    @pytest.mark.asyncio
     async def test_scheduling_shows_form_when_no_input(self):
         flow = _make_options_flow()
         result = await flow.async_step_scheduling(user_input=None)
         assert result["type"] == "form"
         assert result["step_id"] == "scheduling"
 
-    @pytest.mark.asyncio
     async def test_advanced_shows_form_when_no_input(self):
         flow = _make_options_flow()
         result = await flow.async_step_advanced(user_input=None)
         assert result["type"] == "form"
         assert result["step_id"] == "advanced"
 
-    @pytest.mark.asyncio
     async def test_tariffs_menu_add_goes_to_add_tariff(self):
         flow = _make_options_flow()
         flow._tariffs = []
@@ -199,7 +208,6 @@ class TestOptionsFlowNavigation:
         assert result["type"] == "form"
         assert result["step_id"] == "add_tariff"
 
-    @pytest.mark.asyncio
     async def test_tariffs_menu_delete_removes_tariff(self):
         flow = _make_options_flow()
         flow._tariffs = [{"name": "Peak"}, {"name": "Off-Peak"}]
@@ -209,7 +217,6 @@ class TestOptionsFlowNavigation:
         assert len(flow._tariffs) == 1
         assert flow._tariffs[0]["name"] == "Peak"
 
-    @pytest.mark.asyncio
     async def test_tariffs_menu_save_creates_entry(self):
         flow = _make_options_flow()
         flow._system_opts = {"grid_import_limit": 10.0}
@@ -220,7 +227,6 @@ class TestOptionsFlowNavigation:
         assert data["grid_import_limit"] == 10.0
         assert len(data["tariff_periods"]) == 1
 
-    @pytest.mark.asyncio
     async def test_add_tariff_appends_and_returns_to_menu(self):
         flow = _make_options_flow()
         flow._tariffs = []
@@ -240,7 +246,6 @@ class TestOptionsFlowNavigation:
         assert flow._tariffs[0]["name"] == "Off-Peak"
         assert result["step_id"] == "tariffs_menu"
 
-    @pytest.mark.asyncio
     async def test_edit_tariff_updates_in_place(self):
         flow = _make_options_flow()
         flow._tariffs = [
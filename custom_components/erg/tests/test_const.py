@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 import voluptuous as vol
 
 from custom_components.erg.const import (
     PLATFORMS,
+    job_unique_id_prefix,
+    make_job_device_info,
     parse_slot_duration_seconds,
+    parse_slot_time,
+    sanitize_entity_id,
     validate_duration,
     validate_time_str,
 )
@@ -30,29 +36,28 @@ class TestPlatforms:
 class TestParseSlotDurationSeconds:
     """Tests for parse_slot_duration_seconds."""
 
-    def test_five_minutes(self):
-        assert parse_slot_duration_seconds("5m") == 300
-
-    def test_one_hour(self):
-        assert parse_slot_duration_seconds("1h") == 3600
-
-    def test_one_hour_thirty_minutes(self):
-        assert parse_slot_duration_seconds("1h30m") == 5400
-
-    def test_seconds_only(self):
-        assert parse_slot_duration_seconds("90s") == 90
-
-    def test_full_hms(self):
-        assert parse_slot_duration_seconds("1h2m3s") == 3723
-
-    def test_empty_string_returns_default(self):
-        assert parse_slot_duration_seconds("") == 300
-
-    def test_invalid_string_returns_default(self):
-        assert parse_slot_duration_seconds("garbage") == 300
-
-    def test_zero_returns_default(self):
-        assert parse_slot_duration_seconds("0s") == 300
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("5m", 300),
+            ("1h", 3600),
+            ("1h30m", 5400),
+            ("90s", 90),
+            ("1h2m3s", 3723),
+            # Empty, unparseable and zero durations fall back to 5 minutes
+            ("", 300),
+            ("garbage", 300),
+            ("0s", 300),
+        ],
+    )
+    def test_parses(self, value, expected):
+        assert parse_slot_duration_seconds(value) == expected
+
+    def test_repeated_option_is_memoized(self):
+        parse_slot_duration_seconds("7m")
+        hits = parse_slot_duration_seconds.cache_info().hits
+        assert parse_slot_duration_seconds("7m") == 420
+        assert parse_slot_duration_seconds.cache_info().hits == hits + 1
 
 
 class TestValidateDuration:
@@ -149,3 +154,38 @@ class TestValidateTimeStr:
     def test_rejects_non_string(self):
         with pytest.raises(vol.Invalid):
             validate_time_str(900)
+
+
+class TestJobUniqueIdPrefix:
+    """Tests for sanitize_entity_id and job_unique_id_prefix."""
+
+    def test_sanitize_replaces_dots(self):
+        assert sanitize_entity_id("switch.pool_pump") == "switch_pool_pump"
+
+    def test_prefix_includes_entry_and_sanitized_entity(self):
+        assert job_unique_id_prefix("entry1", "switch.ev") == "entry1_erg_switch_ev"
+
+
+class TestParseSlotTime:
+    """Tests for parse_slot_time."""
+
+    def test_parses_offset_timestamp(self):
+        result = parse_slot_time("2026-02-27T09:00:00+11:00")
+        assert result == datetime(2026, 2, 27, 9, 0, tzinfo=timezone(timedelta(hours=11)))
+
+    def test_repeated_parse_returns_cached_value(self):
+        assert parse_slot_time("2026-02-27T09:15:00+11:00") is parse_slot_time(
+            "2026-02-27T09:15:00+11:00"
+        )
+
+
+class TestMakeJobDeviceInfo:
+    """Tests for make_job_device_info."""
+
+    def test_groups_by_entity_id(self):
+        info = make_job_device_info("switch.pool_pump")
+        assert info["identifiers"] == {("erg", "switch.pool_pump")}
+        assert info["name"] == "Erg Job: Pool Pump"
+
+    def test_shared_across_entities_of_a_job(self):
+        assert make_job_device_info("switch.ev") is make_job_device_info("switch.ev")
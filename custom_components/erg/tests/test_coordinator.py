@@ -16,7 +16,7 @@ from custom_components.erg.coordinator import (
     resolve_soc_kwh,
 )
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 
 class TestResolveSocKwh:
@@ -477,7 +477,6 @@ class TestScheduleWithPolling:
         coord.api_client = api_client
         return coord
 
-    @pytest.mark.asyncio
     async def test_async_happy_path(self):
         """Async submit, poll pending, poll complete — returns result."""
         api = MagicMock(spec=ErgApiClient)
@@ -505,7 +504,6 @@ class TestScheduleWithPolling:
         api.submit_schedule_async.assert_called_once_with({"system": {}})
         assert api.get_schedule_job.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_fallback_to_sync(self):
         """When submit_schedule_async returns None, falls back to sync."""
         api = MagicMock(spec=ErgApiClient)
@@ -520,7 +518,6 @@ class TestScheduleWithPolling:
         api.schedule.assert_called_once_with({"system": {}})
         api.get_schedule_job.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_poll_timeout(self):
         """When polling never completes, raises ErgApiError."""
         api = MagicMock(spec=ErgApiClient)
@@ -539,7 +536,6 @@ class TestScheduleWithPolling:
 
         assert api.get_schedule_job.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_poll_failed_job(self):
         """When job fails, raises ErgApiError with code and message."""
         api = MagicMock(spec=ErgApiClient)
@@ -594,3 +590,83 @@ class TestPreservationBoundsPassthrough:
         }
         assert system["preservation_lower_bound"] == 0.1
         assert system["preservation_upper_bound"] == 0.95
+
+
+class TestLastResultPersistence:
+    """Tests for restoring the last-known-good schedule across restarts."""
+
+    def _make_coordinator(self, stored):
+        coord = object.__new__(ErgScheduleCoordinator)
+        coord.data = None
+        coord.config_entry = MagicMock()
+        coord.config_entry.options = {"slot_duration": "5m"}
+        coord._store = MagicMock()
+        coord._store.async_load = AsyncMock(return_value=stored)
+        return coord
+
+    def _schedule_ending_in(self, delta: timedelta) -> dict:
+        # Last slot starts 5 minutes before the schedule ends
+        slot = datetime.now().astimezone() + delta - timedelta(minutes=5)
+        return {"assignments": [{"entity": "switch.pump", "slots": [slot.isoformat()]}]}
+
+    async def test_loads_stored_schedule(self):
+        stored = self._schedule_ending_in(timedelta(hours=1))
+        coord = self._make_coordinator(stored)
+        assert await coord.async_load_last_result() is True
+        assert coord.data == stored
+
+    async def test_restored_schedule_leaves_update_unsuccessful(self):
+        coord = self._make_coordinator(self._schedule_ending_in(timedelta(hours=1)))
+        coord.last_update_success = False
+        assert await coord.async_load_last_result() is True
+        assert coord.last_update_success is False
+
+    async def test_battery_profile_counts_towards_schedule_end(self):
+        slot = datetime.now().astimezone() + timedelta(hours=1)
+        stored = {"assignments": [], "battery_profile": [{"time": slot.isoformat()}]}
+        coord = self._make_coordinator(stored)
+        assert await coord.async_load_last_result() is True
+
+    async def test_ended_schedule_ignored(self):
+        coord = self._make_coordinator(self._schedule_ending_in(-timedelta(minutes=1)))
+        assert await coord.async_load_last_result() is False
+        assert coord.data is None
+
+    async def test_schedule_without_slots_ignored(self):
+        coord = self._make_coordinator({"assignments": [{"entity": "switch.pump", "slots": []}]})
+        assert await coord.async_load_last_result() is False
+        assert coord.data is None
+
+    async def test_nothing_stored(self):
+        coord = self._make_coordinator(None)
+        assert await coord.async_load_last_result() is False
+        assert coord.data is None
+
+    async def test_load_error_is_not_fatal(self):
+        coord = self._make_coordinator(None)
+        coord._store.async_load = AsyncMock(side_effect=ValueError("corrupt"))
+        assert await coord.async_load_last_result() is False
+        assert coord.data is None
+
+    async def test_successful_update_schedules_delayed_save(self):
+        coord = object.__new__(ErgScheduleCoordinator)
+        coord.data = None
+        coord.hass = MagicMock()
+        coord.hass.data = {}
+        coord.config_entry = MagicMock()
+        coord.config_entry.options = {}
+        coord._elapsed_today = {}
+        coord._last_elapsed_update = None
+        coord._tracking_date = None
+        coord._store = MagicMock()
+        result = {"assignments": []}
+        coord.api_client = MagicMock()
+        coord.api_client.submit_schedule_async = AsyncMock(return_value=None)
+        coord.api_client.schedule = AsyncMock(return_value=result)
+
+        assert await coord._async_update_data() is result
+
+        coord._store.async_delay_save.assert_called_once()
+        data_func, delay = coord._store.async_delay_save.call_args.args
+        assert data_func() is result
+        assert delay > 0
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from custom_components.erg.device_action import (
     ACTION_TYPES,
     _get_job_entity_id_from_device,
@@ -103,7 +101,6 @@ class TestGetJobEntityIdFromDevice:
 # ---------------------------------------------------------------------------
 
 class TestAsyncGetActions:
-    @pytest.mark.asyncio
     async def test_returns_ten_actions(self):
         device = _make_device(identifiers={("erg", ENTITY_ID)})
         registry = _make_registry(devices={DEVICE_ID: device})
@@ -115,7 +112,6 @@ class TestAsyncGetActions:
         types = {a["type"] for a in actions}
         assert types == set(ACTION_TYPES)
 
-    @pytest.mark.asyncio
     async def test_all_actions_have_correct_keys(self):
         device = _make_device(identifiers={("erg", ENTITY_ID)})
         registry = _make_registry(devices={DEVICE_ID: device})
@@ -129,7 +125,6 @@ class TestAsyncGetActions:
             assert "entity_id" not in action
             assert "type" in action
 
-    @pytest.mark.asyncio
     async def test_returns_empty_for_unknown_device(self):
         registry = _make_registry(devices={})
         hass = _make_hass()
@@ -144,63 +139,54 @@ class TestAsyncGetActions:
 # ---------------------------------------------------------------------------
 
 class TestAsyncGetActionCapabilities:
-    @pytest.mark.asyncio
     async def test_bool_schema_for_force(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_force"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_bool_schema_for_enabled(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_enabled"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_float_schema_for_benefit(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_benefit"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_float_schema_for_ac_power(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_ac_power"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_float_schema_for_dc_power(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_dc_power"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_string_schema_for_maximum_duration(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_maximum_duration"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_string_schema_for_minimum_duration(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_minimum_duration"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_string_schema_for_minimum_burst(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_minimum_burst"})
         schema = caps["extra_fields"]
         assert "value" in schema.schema
 
-    @pytest.mark.asyncio
     async def test_two_field_schema_for_time_window(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_time_window"})
@@ -214,7 +200,6 @@ class TestAsyncGetActionCapabilities:
 # ---------------------------------------------------------------------------
 
 class TestAsyncCallActionFromConfig:
-    @pytest.mark.asyncio
     async def test_updates_force_attribute(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": ENTITY_ID,
@@ -238,7 +223,6 @@ class TestAsyncCallActionFromConfig:
         assert entity.extra_state_attributes["force"] is True
         entry_data["coordinator"].async_request_refresh.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_updates_benefit_attribute(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": ENTITY_ID,
@@ -261,7 +245,6 @@ class TestAsyncCallActionFromConfig:
 
         assert entity.extra_state_attributes["benefit"] == 42.5
 
-    @pytest.mark.asyncio
     async def test_updates_time_window_attributes(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": ENTITY_ID,
@@ -287,7 +270,6 @@ class TestAsyncCallActionFromConfig:
         assert entity.extra_state_attributes["time_window_start"] == "22:00"
         assert entity.extra_state_attributes["time_window_end"] == "06:00"
 
-    @pytest.mark.asyncio
     async def test_noop_for_missing_device(self):
         registry = _make_registry(devices={})
         entry_data = _make_entry_data()
@@ -303,7 +285,6 @@ class TestAsyncCallActionFromConfig:
 
         entry_data["coordinator"].async_request_refresh.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_noop_for_missing_entity(self):
         device = _make_device(identifiers={("erg", "switch.missing")})
         registry = _make_registry(devices={DEVICE_ID: device})
@@ -320,7 +301,6 @@ class TestAsyncCallActionFromConfig:
 
         entry_data["coordinator"].async_request_refresh.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_refreshes_coordinator(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": ENTITY_ID,
@@ -349,7 +329,6 @@ class TestAsyncCallActionFromConfig:
 # ---------------------------------------------------------------------------
 
 class TestSetEvCharging:
-    @pytest.mark.asyncio
     async def test_ev_charging_capabilities_schema(self):
         hass = MagicMock()
         caps = await async_get_action_capabilities(hass, {"type": "set_ev_charging"})
@@ -360,7 +339,6 @@ class TestSetEvCharging:
         assert "benefit" in keys
         assert "low_benefit" in keys
 
-    @pytest.mark.asyncio
     async def test_ev_charging_updates_all_attributes(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": ENTITY_ID,
@@ -394,7 +372,6 @@ class TestSetEvCharging:
         assert attrs["low_benefit"] == 2.0
         entry_data["coordinator"].async_request_refresh.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_ev_charging_idempotent_overwrite(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": ENTITY_ID,
@@ -440,7 +417,6 @@ class TestSetEvCharging:
         assert attrs["benefit"] == 5.0
         assert attrs["low_benefit"] == 1.0
 
-    @pytest.mark.asyncio
     async def test_ev_charging_defaults_optional_fields(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": ENTITY_ID,
@@ -586,3 +586,24 @@ class TestComputePriceThresholds:
         assert import_t is None
         # Export at 0.10, 0.05, 0.08 → min is 0.05
         assert export_t == 0.05
+
+    def test_malformed_periods_skipped(self):
+        from custom_components.erg.coordinator import ErgScheduleCoordinator
+
+        coord = object.__new__(ErgScheduleCoordinator)
+        schedule_data = {
+            "battery_profile": [
+                {"time": "2026-03-01T08:00:00+00:00", "grid_import": 1.0, "grid_export": 0},
+                {"time": "not-a-time", "grid_import": 1.0, "grid_export": 0},
+            ]
+        }
+        tariff_periods = [
+            {"start": "garbage", "end": "2026-03-01T09:00:00+00:00",
+             "import_price": 0.99, "feed_in_price": 0.0},
+            {"end": "2026-03-01T09:00:00+00:00", "import_price": 0.98},
+            {"start": "2026-03-01T08:00:00+00:00", "end": "2026-03-01T09:00:00+00:00",
+             "import_price": 0.20, "feed_in_price": 0.05},
+        ]
+        import_t, export_t = coord._compute_price_thresholds(schedule_data, tariff_periods)
+        assert import_t == 0.20
+        assert export_t is None
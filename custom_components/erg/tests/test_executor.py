@@ -5,8 +5,6 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from custom_components.erg.executor import ScheduleExecutor
 
 
@@ -16,6 +14,7 @@ AEST = timezone(timedelta(hours=10))
 def _make_coordinator(data=None):
     coordinator = MagicMock()
     coordinator.data = data
+    coordinator.schedule_index = None
     return coordinator
 
 
@@ -78,7 +77,6 @@ class TestScheduleExecutorStartStop:
 class TestScheduleExecutorPauseResume:
     """Tests for pause/resume."""
 
-    @pytest.mark.asyncio
     async def test_paused_tick_does_nothing(self):
         hass = _make_hass({"switch.pool_pump": "off"})
         data = {
@@ -97,7 +95,6 @@ class TestScheduleExecutorPauseResume:
         await executor._async_tick(now)
         hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_resume_allows_tick(self):
         hass = _make_hass({"switch.pool_pump": "off"})
         data = {
@@ -121,7 +118,6 @@ class TestScheduleExecutorPauseResume:
 class TestScheduleExecutorTick:
     """Tests for _async_tick behavior."""
 
-    @pytest.mark.asyncio
     async def test_tick_with_no_data_is_noop(self):
         hass = _make_hass()
         coordinator = _make_coordinator(data=None)
@@ -129,7 +125,6 @@ class TestScheduleExecutorTick:
         await executor._async_tick(datetime.now(tz=AEST))
         hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_turns_on_entity_when_scheduled_and_off(self):
         hass = _make_hass({"switch.pool_pump": "off"})
         data = {
@@ -150,7 +145,6 @@ class TestScheduleExecutorTick:
             "homeassistant", "turn_on", {"entity_id": "switch.pool_pump"}
         )
 
-    @pytest.mark.asyncio
     async def test_turns_off_entity_when_not_scheduled_and_on(self):
         hass = _make_hass({"switch.pool_pump": "on"})
         data = {
@@ -172,7 +166,6 @@ class TestScheduleExecutorTick:
             "homeassistant", "turn_off", {"entity_id": "switch.pool_pump"}
         )
 
-    @pytest.mark.asyncio
     async def test_no_call_when_state_matches_schedule(self):
         hass = _make_hass({"switch.pool_pump": "on"})
         data = {
@@ -192,7 +185,6 @@ class TestScheduleExecutorTick:
 
         hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_skips_unavailable_entity(self):
         hass = _make_hass({"switch.pool_pump": "unavailable"})
         data = {
@@ -211,7 +203,6 @@ class TestScheduleExecutorTick:
 
         hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_skips_unknown_entity(self):
         hass = _make_hass({"switch.pool_pump": "unknown"})
         data = {
@@ -230,7 +221,6 @@ class TestScheduleExecutorTick:
 
         hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_skips_entity_not_in_hass(self):
         hass = _make_hass({})  # No entities registered
         data = {
@@ -249,7 +239,6 @@ class TestScheduleExecutorTick:
 
         hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_skips_dunder_entities(self):
         hass = _make_hass({"__solar__": "off"})
         data = {
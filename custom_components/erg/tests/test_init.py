@@ -0,0 +1,89 @@
+"""Tests for __init__.py — first refresh, persisted-schedule fallback, entry removal."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.erg import async_remove_entry, async_setup_entry
+from custom_components.erg.coordinator import last_result_store_key
+
+
+def _make_hass() -> MagicMock:
+    hass = MagicMock()
+    hass.data = {}
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    hass.services.has_service.return_value = True
+    return hass
+
+
+def _make_entry() -> MagicMock:
+    entry = MagicMock()
+    entry.entry_id = "entry_1"
+    entry.data = {CONF_HOST: "erg.local", CONF_PORT: 8080, "api_key": "key"}
+    entry.options = {}
+    entry.subentries = {}
+    return entry
+
+
+def _make_coordinator(first_refresh_error=None, stored=False) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.async_config_entry_first_refresh = AsyncMock(
+        side_effect=first_refresh_error
+    )
+    coordinator.async_load_last_result = AsyncMock(return_value=stored)
+    coordinator.async_refresh = AsyncMock()
+    return coordinator
+
+
+async def _setup(coordinator: MagicMock) -> bool:
+    with (
+        patch(
+            "custom_components.erg.coordinator.ErgScheduleCoordinator",
+            return_value=coordinator,
+        ),
+        patch("custom_components.erg.executor.ScheduleExecutor"),
+    ):
+        return await async_setup_entry(_make_hass(), _make_entry())
+
+
+class TestAsyncSetupEntry:
+    """The first refresh always runs; the stored schedule is only a fallback."""
+
+    async def test_first_refresh_runs_without_loading_store(self):
+        coordinator = _make_coordinator(stored=True)
+        assert await _setup(coordinator) is True
+        coordinator.async_config_entry_first_refresh.assert_awaited_once()
+        coordinator.async_load_last_result.assert_not_awaited()
+
+    async def test_failed_refresh_falls_back_to_stored_schedule(self):
+        coordinator = _make_coordinator(ConfigEntryNotReady(), stored=True)
+        assert await _setup(coordinator) is True
+        coordinator.async_load_last_result.assert_awaited_once()
+
+    async def test_failed_refresh_without_stored_schedule_retries(self):
+        coordinator = _make_coordinator(ConfigEntryNotReady(), stored=False)
+        with pytest.raises(ConfigEntryNotReady):
+            await _setup(coordinator)
+
+    async def test_other_errors_propagate(self):
+        coordinator = _make_coordinator(RuntimeError("auth"), stored=True)
+        with pytest.raises(RuntimeError):
+            await _setup(coordinator)
+        coordinator.async_load_last_result.assert_not_awaited()
+
+
+class TestAsyncRemoveEntry:
+    """Removing the config entry deletes its persisted schedule."""
+
+    async def test_removes_store(self):
+        hass = MagicMock()
+        with patch("homeassistant.helpers.storage.Store") as store_cls:
+            store_cls.return_value.async_remove = AsyncMock()
+            await async_remove_entry(hass, _make_entry())
+        assert store_cls.call_args.args[2] == last_result_store_key("entry_1")
+        store_cls.return_value.async_remove.assert_awaited_once()
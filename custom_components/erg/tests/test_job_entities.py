@@ -1,10 +1,19 @@
-"""Tests for job_entities.py — ErgJobEntity and job_entity_to_dict."""
+"""Tests for job_entities.py — ErgJobEntity, job_entity_to_dict and setup helpers."""
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, call
+
 import pytest
 
-from custom_components.erg.job_entities import ErgJobEntity, job_entity_to_dict
+from custom_components.erg.job_entities import (
+    ErgJobEntity,
+    add_entities_by_subentry,
+    current_time,
+    job_entity_to_dict,
+    public_job_items,
+)
 from custom_components.erg.const import DOMAIN
 
 
@@ -328,3 +337,62 @@ class TestJobEntityToDict:
             assert result["force"] == job["force"]
             if job["recurrence"] is not None:
                 assert result["recurrence"]["frequency"] == job["recurrence"]["frequency"]
+
+
+class TestPublicJobItems:
+    """Tests for public_job_items."""
+
+    def test_skips_dunder_and_attaches_subentry_ids(self):
+        pool = ErgJobEntity(ENTRY_ID, {"entity_id": "switch.pool_pump"})
+        ev = ErgJobEntity(ENTRY_ID, {"entity_id": "switch.ev"})
+        internal = ErgJobEntity(ENTRY_ID, {"entity_id": "__battery__"})
+        entry_data = {
+            "job_entities": {
+                "switch.pool_pump": pool,
+                "__battery__": internal,
+                "switch.ev": ev,
+            },
+            "_subentry_id_map": {"switch.ev": "sub_1"},
+        }
+        assert public_job_items(entry_data) == [
+            ("switch.pool_pump", pool, None),
+            ("switch.ev", ev, "sub_1"),
+        ]
+
+    def test_empty_entry_data(self):
+        assert public_job_items({}) == []
+
+
+class TestAddEntitiesBySubentry:
+    """Tests for add_entities_by_subentry."""
+
+    def test_no_subentry_group_added_first(self):
+        add = MagicMock()
+        add_entities_by_subentry(add, {"sub_1": ["a"], None: ["b"], "sub_2": ["c"]})
+        assert add.call_args_list == [
+            call(["b"]),
+            call(["a"], config_subentry_id="sub_1"),
+            call(["c"], config_subentry_id="sub_2"),
+        ]
+
+    def test_empty_groups_skipped(self):
+        add = MagicMock()
+        add_entities_by_subentry(add, {None: [], "sub_1": []})
+        add.assert_not_called()
+
+
+class TestCurrentTime:
+    """Tests for current_time."""
+
+    def test_returns_coordinator_update_now(self):
+        now = datetime(2025, 1, 15, 10, 2, 0, tzinfo=timezone(timedelta(hours=10)))
+        coordinator = MagicMock()
+        coordinator.update_now = now
+        assert current_time(coordinator) is now
+
+    def test_falls_back_to_aware_wall_clock(self):
+        coordinator = MagicMock()
+        coordinator.update_now = None
+        now = current_time(coordinator)
+        assert now.tzinfo is not None
+        assert abs(now - datetime.now(timezone.utc)) < timedelta(minutes=1)
@@ -6,7 +6,11 @@ from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
-from custom_components.erg.jobs import day_matches, expand_recurring_jobs
+from custom_components.erg.jobs import (
+    day_matches,
+    expand_recurring_jobs,
+    recurrence_weekdays,
+)
 
 UTC = timezone.utc
 
@@ -56,6 +60,29 @@ class TestDayMatches:
         assert day_matches(date(2026, 2, 16), rec) is False
 
 
+class TestRecurrenceWeekdays:
+    """Tests for recurrence_weekdays."""
+
+    def test_daily_is_every_day(self):
+        assert recurrence_weekdays({"frequency": "daily"}) == set(range(7))
+
+    def test_weekdays_and_weekends_partition_week(self):
+        weekdays = recurrence_weekdays({"frequency": "weekdays"})
+        weekends = recurrence_weekdays({"frequency": "weekends"})
+        assert weekdays == {0, 1, 2, 3, 4}
+        assert weekends == {5, 6}
+
+    def test_weekly_defaults_to_monday(self):
+        assert recurrence_weekdays({"frequency": "weekly"}) == {0}
+
+    def test_custom_uses_days_of_week(self):
+        rec = {"frequency": "custom", "days_of_week": [1, 6]}
+        assert recurrence_weekdays(rec) == {1, 6}
+
+    def test_unknown_frequency_is_empty(self):
+        assert recurrence_weekdays({"frequency": "monthly"}) == set()
+
+
 class TestExpandRecurringJobs:
     """Tests for expand_recurring_jobs."""
 
@@ -0,0 +1,202 @@
+"""Tests for schedule_index.py — per-schedule lookup tables."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from custom_components.erg.schedule_index import ScheduleIndex, get_schedule_index
+
+AEDT = timezone(timedelta(hours=11))
+
+
+def _make_coordinator(data):
+    coordinator = MagicMock()
+    coordinator.data = data
+    coordinator.schedule_index = None
+    return coordinator
+
+
+class TestGetScheduleIndex:
+    """Tests for the per-coordinator index in get_schedule_index."""
+
+    def test_reused_for_same_schedule(self):
+        coordinator = _make_coordinator({"assignments": []})
+        first = get_schedule_index(coordinator)
+        assert get_schedule_index(coordinator) is first
+        assert coordinator.schedule_index is first
+
+    def test_rebuilt_for_new_schedule(self):
+        coordinator = _make_coordinator({"assignments": []})
+        first = get_schedule_index(coordinator)
+        new = {"assignments": []}
+        coordinator.data = new
+        second = get_schedule_index(coordinator)
+        assert second is not first
+        assert second.data is new
+
+    def test_coordinators_keep_their_own_index(self):
+        first = _make_coordinator({"assignments": []})
+        second = _make_coordinator({"assignments": []})
+        first_index = get_schedule_index(first)
+        second_index = get_schedule_index(second)
+        assert first_index is not second_index
+        for _ in range(3):
+            assert get_schedule_index(first) is first_index
+            assert get_schedule_index(second) is second_index
+
+
+class TestEntitySlots:
+    """Tests for the per-entity slot tables."""
+
+    def test_slots_sorted_across_assignments(self):
+        data = {
+            "assignments": [
+                {"entity": "switch.ev", "slots": ["2026-02-28T11:00:00+11:00"]},
+                {"entity": "switch.ev", "slots": ["2026-02-27T14:30:00+11:00"]},
+            ]
+        }
+        times, slots = ScheduleIndex(data).entity_slots["switch.ev"]
+        assert slots == ["2026-02-27T14:30:00+11:00", "2026-02-28T11:00:00+11:00"]
+        assert times == [
+            datetime(2026, 2, 27, 14, 30, tzinfo=AEDT),
+            datetime(2026, 2, 28, 11, 0, tzinfo=AEDT),
+        ]
+
+    def test_entity_without_slots_absent(self):
+        data = {"assignments": [{"entity": "switch.ev", "slots": []}]}
+        assert "switch.ev" not in ScheduleIndex(data).entity_slots
+
+    def test_slot_table_excludes_dunder_entities(self):
+        data = {
+            "assignments": [
+                {"entity": "__solar__", "slots": ["2026-02-27T10:00:00+11:00"]},
+                {"entity": "switch.ev", "slots": ["2026-02-27T11:00:00+11:00"]},
+            ]
+        }
+        assert ScheduleIndex(data).slot_entities == ["switch.ev"]
+
+
+class TestNextEntity:
+    """Tests for ScheduleIndex.next_entity."""
+
+    DATA = {
+        "assignments": [
+            {"entity": "switch.ev", "slots": ["2026-02-27T14:00:00+11:00"]},
+            {"entity": "switch.pool", "slots": ["2026-02-27T10:00:00+11:00"]},
+        ]
+    }
+
+    def test_follows_now_forwards_and_backwards(self):
+        index = ScheduleIndex(self.DATA)
+        assert index.next_entity(datetime(2026, 2, 27, 9, 0, tzinfo=AEDT)) == "switch.pool"
+        assert index.next_entity(datetime(2026, 2, 27, 10, 0, tzinfo=AEDT)) == "switch.ev"
+        assert index.next_entity(datetime(2026, 2, 27, 15, 0, tzinfo=AEDT)) is None
+        assert index.next_entity(datetime(2026, 2, 27, 9, 59, tzinfo=AEDT)) == "switch.pool"
+
+    def test_empty_schedule(self):
+        index = ScheduleIndex({"assignments": []})
+        assert index.next_entity(datetime(2026, 2, 27, 9, 0, tzinfo=AEDT)) is None
+
+
+class TestSlotPowerLookups:
+    """Tests for load_ac_at, solar_dc_at and grid_power_at."""
+
+    SLOT = timedelta(minutes=5)
+    DATA = {
+        "assignments": [
+            {"entity": "switch.pool", "ac_power": 2.0,
+             "slots": ["2026-02-27T10:00:00+11:00", "2026-02-26T23:00:00Z"]},
+            {"entity": "switch.ev", "ac_power": 7.0,
+             "slots": ["2026-02-27T10:05:00+11:00", "2026-02-27T10:00:00+11:00"]},
+            {"entity": "__solar__", "dc_power": -3.0,
+             "slots": ["2026-02-27T10:00:00+11:00"]},
+        ],
+        "battery_profile": [
+            {"time": "2026-02-27T10:00:00+11:00", "grid_import": 4.0, "grid_export": 0.0},
+            {"time": "2026-02-27T10:00:00+11:00", "grid_import": 9.0, "grid_export": 9.0},
+            {"time": "2026-02-27T10:05:00+11:00", "grid_import": 0.0, "grid_export": 1.5},
+        ],
+    }
+
+    def test_load_counts_each_assignment_once_per_slot(self):
+        index = ScheduleIndex(self.DATA)
+        # The pool pump lists 10:00 twice (once in UTC), but counts once
+        assert index.load_ac_at(datetime(2026, 2, 27, 10, 2, tzinfo=AEDT), self.SLOT) == 9.0
+        assert index.load_ac_at(datetime(2026, 2, 27, 10, 5, tzinfo=AEDT), self.SLOT) == 7.0
+        assert index.load_ac_at(datetime(2026, 2, 27, 10, 10, tzinfo=AEDT), self.SLOT) == 0.0
+        assert index.load_ac_at(datetime(2026, 2, 27, 9, 59, tzinfo=AEDT), self.SLOT) == 0.0
+
+    def test_solar_is_absolute_dc(self):
+        index = ScheduleIndex(self.DATA)
+        assert index.solar_dc_at(datetime(2026, 2, 27, 10, 2, tzinfo=AEDT), self.SLOT) == 3.0
+        assert index.solar_dc_at(datetime(2026, 2, 27, 10, 5, tzinfo=AEDT), self.SLOT) == 0.0
+
+    def test_grid_power_first_profile_entry_wins(self):
+        index = ScheduleIndex(self.DATA)
+        assert index.grid_power_at(
+            datetime(2026, 2, 27, 10, 2, tzinfo=AEDT), self.SLOT
+        ) == (4.0, 0.0)
+        assert index.grid_power_at(
+            datetime(2026, 2, 27, 10, 7, tzinfo=AEDT), self.SLOT
+        ) == (0.0, 1.5)
+        assert index.grid_power_at(
+            datetime(2026, 2, 27, 11, 0, tzinfo=AEDT), self.SLOT
+        ) == (0.0, 0.0)
+
+    def test_unaligned_overlapping_slots_all_counted(self):
+        data = {
+            "assignments": [
+                {"entity": "switch.a", "ac_power": 1000.0, "slots": ["2026-02-27T10:00:00+11:00"]},
+                {"entity": "switch.b", "ac_power": 500.0, "slots": ["2026-02-27T10:02:00+11:00"]},
+                {"entity": "__solar__", "dc_power": 2.0, "slots": ["2026-02-27T10:00:00+11:00"]},
+                {"entity": "__solar__", "dc_power": 1.0, "slots": ["2026-02-27T10:03:00+11:00"]},
+            ],
+        }
+        index = ScheduleIndex(data)
+        now = datetime(2026, 2, 27, 10, 3, tzinfo=AEDT)
+        assert index.load_ac_at(now, self.SLOT) == 1500.0
+        assert index.solar_dc_at(now, self.SLOT) == 3.0
+        later = datetime(2026, 2, 27, 10, 6, tzinfo=AEDT)
+        assert index.load_ac_at(later, self.SLOT) == 500.0
+        assert index.solar_dc_at(later, self.SLOT) == 1.0
+
+    def test_overlapping_slots_of_one_assignment_count_once(self):
+        data = {
+            "assignments": [
+                {"entity": "switch.a", "ac_power": 2.0,
+                 "slots": ["2026-02-27T10:00:00+11:00", "2026-02-27T10:02:00+11:00"]},
+            ],
+        }
+        index = ScheduleIndex(data)
+        assert index.load_ac_at(datetime(2026, 2, 27, 10, 3, tzinfo=AEDT), self.SLOT) == 2.0
+
+    def test_grid_power_first_running_row_wins_when_unaligned(self):
+        data = {
+            "battery_profile": [
+                {"time": "2026-02-27T10:00:00+11:00", "grid_import": 2.0, "grid_export": 0.0},
+                {"time": "2026-02-27T10:02:00+11:00", "grid_import": 1.0, "grid_export": 0.0},
+            ],
+        }
+        index = ScheduleIndex(data)
+        assert index.grid_power_at(
+            datetime(2026, 2, 27, 10, 3, tzinfo=AEDT), self.SLOT
+        ) == (2.0, 0.0)
+        assert index.grid_power_at(
+            datetime(2026, 2, 27, 10, 6, tzinfo=AEDT), self.SLOT
+        ) == (1.0, 0.0)
+
+
+class TestLazyTables:
+    """Tables are only built when read."""
+
+    def test_only_read_tables_are_built(self):
+        data = {
+            "assignments": [{"entity": "switch.ev", "slots": ["2026-02-27T14:00:00+11:00"]}],
+            "battery_profile": [{"time": "2026-02-27T14:00:00+11:00", "soc_kwh": 5.0}],
+        }
+        index = ScheduleIndex(data)
+        assert index.battery_forecast is not None
+        assert "battery_forecast" in vars(index)
+        assert "by_entity" not in vars(index)
+        assert "entity_slots" not in vars(index)
@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
-
-import pytest
+from unittest.mock import MagicMock
 
 from custom_components.erg.sensor import (
     ErgGlobalSensor,
@@ -26,6 +24,8 @@ def _make_coordinator(data=None):
     coordinator = MagicMock()
     coordinator.data = data
     coordinator.last_update_success_time = None
+    coordinator.update_now = None
+    coordinator.schedule_index = None
     return coordinator
 
 
@@ -140,6 +140,15 @@ class TestBatterySocForecastAttributes:
         assert len(attrs["forecast"]) == 1
         assert attrs["forecast"][0][1] == 5.0
 
+    def test_forecast_computed_once_per_schedule(self):
+        data = {"battery_profile": [{"time": "2025-01-15T09:00:00+10:00", "soc_kwh": 5.0}]}
+        coordinator = _make_coordinator(data=data)
+        entry = _make_entry()
+        desc = next(d for d in GLOBAL_SENSORS if d.key == "battery_soc_forecast")
+        sensor = ErgGlobalSensor(coordinator, entry, desc)
+        first = sensor.extra_state_attributes["forecast"]
+        assert sensor.extra_state_attributes["forecast"] is first
+
 
 class TestFindNextJobEntity:
     """Tests for _find_next_job_entity helper."""
@@ -157,7 +166,7 @@ class TestFindNextJobEntity:
                 },
             ]
         }
-        result = _find_next_job_entity(data, now)
+        result = _find_next_job_entity(_make_coordinator(data), now)
         assert result == "switch.pool_pump"
 
     def test_skips_dunder_entities(self):
@@ -170,7 +179,7 @@ class TestFindNextJobEntity:
                 },
             ]
         }
-        result = _find_next_job_entity(data, now)
+        result = _find_next_job_entity(_make_coordinator(data), now)
         assert result is None
 
     def test_returns_none_when_all_slots_past(self):
@@ -183,9 +192,28 @@ class TestFindNextJobEntity:
                 },
             ]
         }
-        result = _find_next_job_entity(data, now)
+        result = _find_next_job_entity(_make_coordinator(data), now)
         assert result is None
 
+    def test_picks_earliest_across_entities(self):
+        now = datetime(2025, 1, 15, 8, 0, 0, tzinfo=timezone(timedelta(hours=10)))
+        data = {
+            "assignments": [
+                {
+                    "entity": "switch.pool_pump",
+                    "slots": ["2025-01-15T11:00:00+10:00"],
+                },
+                {
+                    "entity": "switch.ev_charger",
+                    "slots": [
+                        "2025-01-15T07:00:00+10:00",
+                        "2025-01-15T09:00:00+10:00",
+                    ],
+                },
+            ]
+        }
+        assert _find_next_job_entity(_make_coordinator(data), now) == "switch.ev_charger"
+
 
 class TestGetAssignmentForEntity:
     """Tests for _get_assignment_for_entity helper."""
@@ -197,12 +225,12 @@ class TestGetAssignmentForEntity:
                 {"entity": "switch.ev_charger", "energy_cost": 0.50},
             ]
         }
-        result = _get_assignment_for_entity(data, "switch.ev_charger")
+        result = _get_assignment_for_entity(_make_coordinator(data), "switch.ev_charger")
         assert result["energy_cost"] == 0.50
 
     def test_returns_none_when_not_found(self):
         data = {"assignments": [{"entity": "switch.pool_pump"}]}
-        assert _get_assignment_for_entity(data, "switch.missing") is None
+        assert _get_assignment_for_entity(_make_coordinator(data), "switch.missing") is None
 
     def test_aggregates_multiple_assignments_for_same_entity(self):
         data = {
@@ -221,10 +249,13 @@ class TestGetAssignmentForEntity:
                 },
             ]
         }
-        result = _get_assignment_for_entity(data, "switch.ev_charger")
+        result = _get_assignment_for_entity(_make_coordinator(data), "switch.ev_charger")
         assert result["run_time_seconds"] == 3600
         assert result["energy_cost"] == 0.25
         assert len(result["slots"]) == 4
+        # Merging must not touch the source assignments.
+        assert data["assignments"][0]["run_time_seconds"] == 1800
+        assert len(data["assignments"][0]["slots"]) == 2
 
     def test_single_assignment_unchanged(self):
         data = {
@@ -237,10 +268,25 @@ class TestGetAssignmentForEntity:
                 },
             ]
         }
-        result = _get_assignment_for_entity(data, "switch.pool_pump")
+        result = _get_assignment_for_entity(_make_coordinator(data), "switch.pool_pump")
         assert result["run_time_seconds"] == 900
         assert result["energy_cost"] == 0.05
         assert len(result["slots"]) == 1
+        assert result is data["assignments"][0]
+
+    def test_index_reused_for_same_schedule(self):
+        data = {"assignments": [{"entity": "switch.pool_pump", "energy_cost": 0.05}]}
+        coordinator = _make_coordinator(data)
+        first = _get_assignment_for_entity(coordinator, "switch.pool_pump")
+        assert _get_assignment_for_entity(coordinator, "switch.pool_pump") is first
+
+    def test_index_rebuilt_for_new_schedule(self):
+        old = {"assignments": [{"entity": "switch.pool_pump", "energy_cost": 0.05}]}
+        new = {"assignments": [{"entity": "switch.pool_pump", "energy_cost": 0.08}]}
+        coordinator = _make_coordinator(old)
+        assert _get_assignment_for_entity(coordinator, "switch.pool_pump")["energy_cost"] == 0.05
+        coordinator.data = new
+        assert _get_assignment_for_entity(coordinator, "switch.pool_pump")["energy_cost"] == 0.08
 
 
 class TestGlobalSensorNativeValue:
@@ -258,14 +304,21 @@ class TestGlobalSensorNativeValue:
         last = datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone(timedelta(hours=10)))
         coordinator = _make_coordinator(data={"some": "data"})
         coordinator.last_update_success_time = last
+        coordinator.update_now = now
         entry = _make_entry()
         desc = next(d for d in GLOBAL_SENSORS if d.key == "schedule_age")
         sensor = ErgGlobalSensor(coordinator, entry, desc)
-        with patch("custom_components.erg.sensor.datetime") as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.fromisoformat = datetime.fromisoformat
-            value = sensor.native_value
-        assert value == 15.0
+        assert sensor.native_value == 15.0
+
+    def test_schedule_age_uses_shared_update_time(self):
+        last = datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone(timedelta(hours=10)))
+        coordinator = _make_coordinator(data={"some": "data"})
+        coordinator.last_update_success_time = last
+        coordinator.update_now = last + timedelta(minutes=5)
+        entry = _make_entry()
+        desc = next(d for d in GLOBAL_SENSORS if d.key == "schedule_age")
+        sensor = ErgGlobalSensor(coordinator, entry, desc)
+        assert sensor.native_value == 5.0
 
     def test_schedule_view_url_returns_url(self):
         coordinator = _make_coordinator(data={"some": "data"})
@@ -418,21 +471,35 @@ class TestPerJobSensors:
             ]
         }
         coordinator = _make_coordinator(data=data)
+        # "now" is after the first slot but before the second
+        coordinator.update_now = datetime(
+            2026, 2, 28, 0, 0, 0, tzinfo=timezone(timedelta(hours=11))
+        )
         entry = _make_entry()
         sensor = ErgJobNextStartSensor(coordinator, entry, "switch.ev")
-        # "now" is after the first slot but before the second
-        now = datetime(2026, 2, 28, 0, 0, 0, tzinfo=timezone(timedelta(hours=11)))
-        with patch("custom_components.erg.sensor.datetime") as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.fromisoformat = datetime.fromisoformat
-            value = sensor.native_value
-        assert value == "2026-02-28T11:00:00+11:00"
+        assert sensor.native_value == "2026-02-28T11:00:00+11:00"
+
+    def test_next_start_returns_earliest_future_slot(self):
+        """Slots out of order across assignments still yield the earliest one."""
+        data = {
+            "assignments": [
+                {"entity": "switch.ev",
+                 "slots": ["2026-02-28T11:00:00+11:00"]},
+                {"entity": "switch.ev",
+                 "slots": ["2026-02-27T14:30:00+11:00"]},
+            ]
+        }
+        coordinator = _make_coordinator(data=data)
+        coordinator.update_now = datetime(
+            2026, 2, 27, 0, 0, 0, tzinfo=timezone(timedelta(hours=11))
+        )
+        sensor = ErgJobNextStartSensor(coordinator, _make_entry(), "switch.ev")
+        assert sensor.native_value == "2026-02-27T14:30:00+11:00"
 
 
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
-    @pytest.mark.asyncio
     async def test_creates_global_and_per_job_entities_from_migration(self, sample_schedule_data):
         """Migration path: jobs in options are converted to job entities."""
         coordinator = _make_coordinator(data=sample_schedule_data)
@@ -460,7 +527,6 @@ class TestAsyncSetupEntry:
         # 11 global + 1 job entity (pool_pump, __solar__ filtered) + 3 per-job sensors
         assert len(added) == 15
 
-    @pytest.mark.asyncio
     async def test_creates_sensors_from_existing_job_entities(self, sample_schedule_data):
         """Non-migration path: job entities already exist."""
         coordinator = _make_coordinator(data=sample_schedule_data)
@@ -486,7 +552,6 @@ class TestAsyncSetupEntry:
         # 11 global + 1 job entity + 3 per-job sensors
         assert len(added) == 15
 
-    @pytest.mark.asyncio
     async def test_filters_dunder_entities(self, sample_schedule_data):
         coordinator = _make_coordinator(data=sample_schedule_data)
         entry = _make_entry(options={})
@@ -76,6 +76,13 @@ class TestFindEntryData:
         assert eid == ENTRY_ID
         assert data is entry_data
 
+    def test_returns_first_entry_set_up(self):
+        first = {"coordinator": MagicMock()}
+        second = {"coordinator": MagicMock()}
+        hass = MagicMock()
+        hass.data = {"erg": {"entry_a": first, "entry_b": second}}
+        assert _find_entry_data(hass) == ("entry_a", first)
+
     def test_raises_when_no_entry(self):
         hass = MagicMock()
         hass.data = {"erg": {}}
@@ -90,7 +97,6 @@ class TestFindEntryData:
 
 
 class TestCreateJob:
-    @pytest.mark.asyncio
     async def test_creates_job_entity(self):
         entry_data = _make_entry_data()
         hass = _make_hass(entry_data)
@@ -109,7 +115,6 @@ class TestCreateJob:
         entry_data["add_job_sensors"].assert_called_once()
         entry_data["coordinator"].async_request_refresh.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_skips_duplicate_entity(self):
         existing_entity = MagicMock()
         entry_data = _make_entry_data(job_entities={"switch.pool_pump": existing_entity})
@@ -125,7 +130,6 @@ class TestCreateJob:
         assert entry_data["job_entities"]["switch.pool_pump"] is existing_entity
         entry_data["coordinator"].async_request_refresh.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_creates_per_job_sensors(self):
         entry_data = _make_entry_data()
         hass = _make_hass(entry_data)
@@ -140,7 +144,6 @@ class TestCreateJob:
         sensors = entry_data["add_per_job_sensors"].call_args[0][0]
         assert len(sensors) == 3  # next_start, run_time, energy_cost
 
-    @pytest.mark.asyncio
     async def test_creates_binary_sensor(self):
         entry_data = _make_entry_data()
         hass = _make_hass(entry_data)
@@ -157,7 +160,6 @@ class TestCreateJob:
 
 
 class TestUpdateJob:
-    @pytest.mark.asyncio
     async def test_updates_existing_entity(self):
         entity = ErgJobEntity(ENTRY_ID, {
             "entity_id": "switch.pool_pump",
@@ -183,7 +185,6 @@ class TestUpdateJob:
         assert entity.extra_state_attributes["entity_id"] == "switch.pool_pump"
         entry_data["coordinator"].async_request_refresh.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_update_nonexistent_entity_warns(self):
         entry_data = _make_entry_data()
         hass = _make_hass(entry_data)
@@ -198,7 +199,6 @@ class TestUpdateJob:
 
 
 class TestDeleteJob:
-    @pytest.mark.asyncio
     async def test_deletes_job_and_sensors(self):
         entity = MagicMock()
         entity.async_remove = AsyncMock()
@@ -228,7 +228,6 @@ class TestDeleteJob:
         assert "switch.pool_pump" not in entry_data["per_job_binary_sensors"]
         entry_data["coordinator"].async_request_refresh.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_entity_warns(self):
         entry_data = _make_entry_data()
         hass = _make_hass(entry_data)
@@ -298,7 +297,6 @@ class TestCreateJobEntity:
 
 
 class TestDeleteJobEntity:
-    @pytest.mark.asyncio
     async def test_removes_everything(self):
         entity = MagicMock()
         entity.async_remove = AsyncMock()
@@ -320,7 +318,6 @@ class TestDeleteJobEntity:
         binary_sensor.async_remove.assert_awaited_once()
         assert "switch.pool_pump" not in entry_data["job_entities"]
 
-    @pytest.mark.asyncio
     async def test_returns_false_for_missing(self):
         entry_data = _make_entry_data()
         result = await delete_job_entity(entry_data, "switch.missing")
@@ -328,7 +325,6 @@ class TestDeleteJobEntity:
 
 
 class TestCreateJobSubentry:
-    @pytest.mark.asyncio
     async def test_create_job_adds_subentry(self):
         mock_entry = _make_mock_entry()
         entry_data = _make_entry_data()
@@ -352,7 +348,6 @@ class TestCreateJobSubentry:
         assert subentry.data["entity_id"] == "switch.pool_pump"
         assert subentry.data["ac_power"] == 1.5
 
-    @pytest.mark.asyncio
     async def test_create_job_tracks_subentry_jobs(self):
         entry_data = _make_entry_data()
         hass = _make_hass(entry_data)
@@ -365,7 +360,6 @@ class TestCreateJobSubentry:
 
         assert "switch.pool_pump" in entry_data["_subentry_jobs"]
 
-    @pytest.mark.asyncio
     async def test_create_job_passes_subentry_id_to_callbacks(self):
         entry_data = _make_entry_data()
         hass = _make_hass(entry_data)
@@ -389,7 +383,6 @@ class TestCreateJobSubentry:
         _, kwargs = entry_data["add_per_job_sensors"].call_args
         assert kwargs.get("config_subentry_id") == sid
 
-    @pytest.mark.asyncio
     async def test_duplicate_does_not_add_subentry(self):
         existing_entity = MagicMock()
         entry_data = _make_entry_data(job_entities={"switch.pool_pump": existing_entity})
@@ -405,7 +398,6 @@ class TestCreateJobSubentry:
 
 
 class TestDeleteJobSubentry:
-    @pytest.mark.asyncio
     async def test_delete_job_removes_subentry(self):
         sub = MagicMock()
         sub.subentry_id = "sub_123"
@@ -428,7 +420,6 @@ class TestDeleteJobSubentry:
         )
         assert "switch.pool_pump" not in entry_data["_subentry_jobs"]
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_does_not_touch_subentries(self):
         mock_entry = _make_mock_entry()
         entry_data = _make_entry_data()
@@ -439,7 +430,6 @@ class TestDeleteJobSubentry:
 
         hass.config_entries.async_remove_subentry.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_delete_job_with_no_matching_subentry(self):
         """Delete succeeds even if no sub-entry matches (legacy job)."""
         mock_entry = _make_mock_entry(subentries={})
@@ -457,7 +447,6 @@ class TestDeleteJobSubentry:
 
 
 class TestCheckHealth:
-    @pytest.mark.asyncio
     async def test_fires_health_event(self):
         coordinator = MagicMock()
         coordinator.async_request_refresh = AsyncMock()
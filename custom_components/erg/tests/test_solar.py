@@ -137,6 +137,35 @@ class TestSolarForecastToBoxes:
         assert boxes[0]["dc_power"] == pytest.approx(-1.0)
         assert boxes[1]["dc_power"] == pytest.approx(-2.0)
 
+    def test_unsorted_forecast_is_ordered(self):
+        wh_hours = {
+            "2026-02-16T12:00:00+00:00": 500.0,
+            "2026-02-16T10:00:00+00:00": 1000.0,
+            "2026-02-16T11:00:00+00:00": 2000.0,
+        }
+        start = datetime(2026, 2, 16, 0, 0, tzinfo=UTC)
+        end = datetime(2026, 2, 17, 0, 0, tzinfo=UTC)
+        boxes = solar_forecast_to_boxes(wh_hours, start, end)
+
+        assert [b["start_time"] for b in boxes] == [
+            "2026-02-16T10:00:00+00:00",
+            "2026-02-16T11:00:00+00:00",
+            "2026-02-16T12:00:00+00:00",
+        ]
+        assert [b["dc_power"] for b in boxes] == pytest.approx([-1.0, -2.0, -0.5])
+
+    def test_same_instant_in_two_formats_last_wins(self):
+        wh_hours = {
+            "2026-02-16T10:00:00+00:00": 1000.0,
+            "2026-02-16T10:00:00Z": 3000.0,
+        }
+        start = datetime(2026, 2, 16, 0, 0, tzinfo=UTC)
+        end = datetime(2026, 2, 17, 0, 0, tzinfo=UTC)
+        boxes = solar_forecast_to_boxes(wh_hours, start, end)
+
+        assert len(boxes) == 1
+        assert boxes[0]["dc_power"] == pytest.approx(-3.0)
+
     def test_each_period_gets_distinct_power(self):
         """Verify each hourly period gets its own dc_power, not an average."""
         wh_hours = {
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -127,6 +129,80 @@ class TestExpandRecurringTariffs:
         assert periods[0]["start"] == start.isoformat()
         assert periods[0]["end"] == end.isoformat()
 
+    def test_windows_keep_wall_clock_across_dst_change(self):
+        """Sydney leaves DST on 2026-04-05; each window stays 17:00-21:00 local."""
+        sydney = ZoneInfo("Australia/Sydney")
+        defs = [
+            {
+                "name": "Peak",
+                "import_price": 0.40,
+                "feed_in_price": 0.05,
+                "recurrence": {
+                    "frequency": "daily",
+                    "time_window_start": "17:00",
+                    "time_window_end": "21:00",
+                },
+            }
+        ]
+        start = datetime(2026, 4, 4, 0, 0, tzinfo=sydney)
+        end = datetime(2026, 4, 6, 0, 0, tzinfo=sydney)
+        periods = expand_recurring_tariffs(defs, start, end, sydney)
+        assert [(p["start"], p["end"]) for p in periods] == [
+            ("2026-04-04T17:00:00+11:00", "2026-04-04T21:00:00+11:00"),
+            ("2026-04-05T17:00:00+10:00", "2026-04-05T21:00:00+10:00"),
+        ]
+
+    def test_weekdays_tariff_over_weekend_horizon(self):
+        defs = [
+            {
+                "name": "Peak",
+                "import_price": 0.35,
+                "feed_in_price": 0.03,
+                "recurrence": {
+                    "frequency": "weekdays",
+                    "time_window_start": "14:00",
+                    "time_window_end": "20:00",
+                },
+            }
+        ]
+        # 2026-02-21/22 is a Saturday/Sunday
+        start = datetime(2026, 2, 21, 0, 0, tzinfo=UTC)
+        end = datetime(2026, 2, 22, 23, 0, tzinfo=UTC)
+        assert expand_recurring_tariffs(defs, start, end, UTC) == []
+
+    def test_empty_horizon_skips_recurring_keeps_absolute(self):
+        """A zero-length horizon expands no recurring windows and never reads
+        entity-linked prices, but absolute periods still pass through."""
+        hass = MagicMock()
+        defs = [
+            {
+                "name": "Peak",
+                "import_price_entity": "sensor.price",
+                "recurrence": {
+                    "frequency": "daily",
+                    "time_window_start": "00:00",
+                    "time_window_end": "23:00",
+                },
+            },
+            {
+                "start": "2026-02-16T00:00:00+00:00",
+                "end": "2026-02-16T06:00:00+00:00",
+                "import_price": 0.10,
+                "feed_in_price": 0.05,
+            },
+        ]
+        instant = datetime(2026, 2, 16, 12, 0, tzinfo=UTC)
+        periods = expand_recurring_tariffs(defs, instant, instant, UTC, hass)
+        assert periods == [
+            {
+                "start": "2026-02-16T00:00:00+00:00",
+                "end": "2026-02-16T06:00:00+00:00",
+                "import_price": 0.10,
+                "feed_in_price": 0.05,
+            }
+        ]
+        hass.states.get.assert_not_called()
+
     def test_weekly_tariff(self):
         defs = [
             {
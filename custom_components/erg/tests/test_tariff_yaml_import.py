@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
-import pytest
-
 from custom_components.erg.config_flow import (
     ErgOptionsFlow,
     _parse_tariff_yaml,
@@ -203,14 +201,12 @@ def _make_options_flow(
 
 
 class TestImportTariffsYamlFlow:
-    @pytest.mark.asyncio
     async def test_shows_form_when_no_input(self):
         flow = _make_options_flow()
         result = await flow.async_step_import_tariffs_yaml(user_input=None)
         assert result["type"] == "form"
         assert result["step_id"] == "import_tariffs_yaml"
 
-    @pytest.mark.asyncio
     async def test_valid_yaml_replaces_tariffs(self):
         flow = _make_options_flow()
         flow._tariffs = [{"name": "Old tariff"}]
@@ -232,7 +228,6 @@ periods:
         assert len(flow._tariffs) == 2
         assert flow._tariffs[0]["import_price"] == 0.20
 
-    @pytest.mark.asyncio
     async def test_invalid_yaml_shows_error(self):
         flow = _make_options_flow()
         flow._tariffs = [{"name": "Existing"}]
@@ -245,7 +240,6 @@ periods:
         # Original tariffs should be unchanged
         assert len(flow._tariffs) == 1
 
-    @pytest.mark.asyncio
     async def test_tariffs_menu_import_yaml_action(self):
         flow = _make_options_flow()
         flow._tariffs = []
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from typing import Any
 
 import voluptuous as vol
@@ -12,16 +13,19 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, friendly_name, make_job_device_info, validate_duration, validate_time_str
-from .job_entities import ErgJobEntity
+from .const import (
+    DOMAIN,
+    friendly_name,
+    job_unique_id_prefix,
+    make_job_device_info,
+    validate_duration,
+    validate_time_str,
+)
+from .job_entities import ErgJobEntity, add_entities_by_subentry, public_job_items
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _sanitize_entity(entity_id: str) -> str:
-    return entity_id.replace(".", "_")
-
-
 class ErgJobText(TextEntity):
     """Text entity for an Erg job string attribute."""
 
@@ -45,17 +49,13 @@ class ErgJobText(TextEntity):
         self._entity_id = entity_id
         self._attr_key = attr
         self._validator = validator
-        sanitized = _sanitize_entity(entity_id)
-        self._attr_unique_id = f"{entry_id}_erg_{sanitized}_{suffix}"
+        self._attr_unique_id = f"{job_unique_id_prefix(entry_id, entity_id)}_{suffix}"
         self._attr_name = f"Erg {name_suffix} \u2014 {friendly_name(entity_id)}"
+        self._attr_device_info = make_job_device_info(entity_id)
         self._attr_icon = icon
         if pattern:
             self._attr_pattern = pattern
 
-    @property
-    def device_info(self):
-        return make_job_device_info(self._entity_id)
-
     @property
     def native_value(self) -> str | None:
         val = self._job_entity.extra_state_attributes.get(self._attr_key)
@@ -156,20 +156,12 @@ async def async_setup_entry(
 
     entry_data["add_job_texts"] = async_add_entities
 
-    subentry_id_map = entry_data.get("_subentry_id_map", {})
-    no_subentry: list[ErgJobText] = []
-    by_subentry: dict[str, list[ErgJobText]] = {}
-    for eid, job_entity in entry_data["job_entities"].items():
-        if eid.startswith("__"):
-            continue
-        sid = subentry_id_map.get(eid)
+    per_job_controls = entry_data.setdefault("per_job_controls", {})
+    by_subentry: defaultdict[str | None, list[ErgJobText]] = defaultdict(list)
+    controls_for = per_job_controls.setdefault
+    for eid, job_entity, sid in public_job_items(entry_data):
         texts = create_job_texts(job_entity, coordinator, entry.entry_id, eid)
-        entry_data.setdefault("per_job_controls", {}).setdefault(eid, []).extend(texts)
-        if sid is None:
-            no_subentry.extend(texts)
-        else:
-            by_subentry.setdefault(sid, []).extend(texts)
-
-    async_add_entities(no_subentry)
-    for sid, entities in by_subentry.items():
-        async_add_entities(entities, config_subentry_id=sid)
+        controls_for(eid, []).extend(texts)
+        by_subentry[sid].extend(texts)
+
+    add_entities_by_subentry(async_add_entities, by_subentry)